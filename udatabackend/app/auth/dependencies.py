@@ -3,6 +3,8 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_session
 from app.repositories.user_repo import UserRepository
+from app.auth.principal_cache import principal_cache
+from app.auth.token_cache import token_cache
 import uuid
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
@@ -12,8 +14,32 @@ async def get_current_user(
         token: str = Depends(oauth2_scheme),
         session: AsyncSession = Depends(get_session)
 ):
-    from app.auth.security import decode_access_token
-    user_id_str = decode_access_token(token)
+    user_id = token_cache.get(token)
+    if user_id is None:
+        user_id = _verify_token(token)
+
+    user = principal_cache.get(user_id)
+    if user is not None:
+        return user
+
+    repo = UserRepository(session)
+    user = await repo.get_by_id(user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found"
+        )
+    # The cached instance outlives this session; detach it so a rollback of
+    # this request's unit of work cannot expire it under later requests.
+    session.expunge(user)
+    principal_cache.set(user_id, user)
+    return user
+
+
+def _verify_token(token: str) -> uuid.UUID:
+    """Verify `token` and remember its subject until the token expires."""
+    from app.auth.security import verify_access_token
+    user_id_str, expires_at = verify_access_token(token)
 
     if not user_id_str:
         raise HTTPException(
@@ -30,11 +56,5 @@ async def get_current_user(
             detail="Invalid token format"
         )
 
-    repo = UserRepository(session)
-    user = await repo.get_by_id(user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
-    return user
+    token_cache.set(token, user_id, expires_at)
+    return user_id
@@ -0,0 +1,102 @@
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", "60"))
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "1024"))
+
+
+class InvalidationBackend(ABC):
+    """Carries invalidations between the caches of several workers.
+
+    Implementations publish a key to every worker (e.g. over Redis pub/sub) and
+    call the subscribed callbacks when another worker publishes one.
+    """
+
+    @abstractmethod
+    def publish(self, key: Hashable) -> None:
+        ...
+
+    @abstractmethod
+    def subscribe(self, callback: Callable[[Hashable], None]) -> None:
+        ...
+
+
+class LocalInvalidationBackend(InvalidationBackend):
+    """Single-process backend: invalidations are delivered synchronously."""
+
+    def __init__(self):
+        self._subscribers: list[Callable[[Hashable], None]] = []
+
+    def publish(self, key: Hashable) -> None:
+        for callback in self._subscribers:
+            callback(key)
+
+    def subscribe(self, callback: Callable[[Hashable], None]) -> None:
+        self._subscribers.append(callback)
+
+
+class PrincipalCache:
+    """Bounded LRU of authenticated users with a per-entry TTL.
+
+    A `ttl` of 0 disables caching. Entries are dropped on `invalidate`, which is
+    also published through the backend so other workers drop theirs.
+    """
+
+    def __init__(self, maxsize: int = PRINCIPAL_CACHE_SIZE, ttl: float = PRINCIPAL_CACHE_TTL,
+                 backend: InvalidationBackend | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self.backend = None
+        self.set_backend(backend or LocalInvalidationBackend())
+
+    def set_backend(self, backend: InvalidationBackend) -> None:
+        self.backend = backend
+        backend.subscribe(self._discard)
+
+    def get(self, user_id):
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            user, expires_at = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return user
+            del self._entries[user_id]
+        self.misses += 1
+        return None
+
+    def set(self, user_id, user) -> None:
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        self._entries[user_id] = (user, time.monotonic() + self.ttl)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id) -> None:
+        self._discard(user_id)
+        self.backend.publish(user_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _discard(self, user_id) -> None:
+        self._entries.pop(user_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+principal_cache = PrincipalCache()
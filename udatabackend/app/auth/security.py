@@ -7,6 +7,8 @@ from fastapi import HTTPException, status
 from jose import jwt, JWTError, ExpiredSignatureError
 from passlib.context import CryptContext
 
+from app.auth.hashing_pool import HashingPool
+
 SECRET_KEY = os.getenv("SECRET_KEY", None) or secrets.token_urlsafe(32)
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
@@ -19,6 +21,16 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+hashing_pool = HashingPool()
+
+async def hash_password_async(password: str) -> str:
+    """hash_password on the hashing pool, for use inside async routes."""
+    return await hashing_pool.run(hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the hashing pool, for use inside async routes."""
+    return await hashing_pool.run(verify_password, plain_password, hashed_password)
+
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT with sub (subject) and exp (expiry). Uses timezone-aware times."""
     now = datetime.now(timezone.utc)
@@ -27,12 +39,16 @@ def create_access_token(subject: str, expires_delta: Optional[timedelta] = None)
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
 def decode_access_token(token: str) -> str:
+    return verify_access_token(token)[0]
+
+def verify_access_token(token: str) -> tuple[str, float]:
+    """Verify the signature and expiry of a token; return its subject and `exp` (epoch seconds)."""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         sub = payload.get("sub")
         if sub is None:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
-        return str(sub)
+        return str(sub), float(payload.get("exp", 0))
     except ExpiredSignatureError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
     except JWTError:
@@ -0,0 +1,66 @@
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Optional
+from uuid import UUID
+
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "4096"))
+
+
+def _digest(token: str) -> bytes:
+    # keyed by digest so the cache never holds usable bearer tokens
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+class TokenCache:
+    """Subjects of access tokens whose signature was already verified.
+
+    A token is immutable and signed, so once verified its subject stays valid
+    until the token's own `exp`; entries are kept exactly that long and
+    evicted least-recently-used beyond `maxsize`. A `maxsize` of 0 disables
+    caching. What the subject may do is still decided by the user row (see
+    `principal_cache`), so nothing here needs invalidating.
+    """
+
+    def __init__(self, maxsize: int = TOKEN_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, token: str) -> Optional[UUID]:
+        key = _digest(token)
+        entry = self._entries.get(key)
+        if entry is not None:
+            user_id, expires_at = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return user_id
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def set(self, token: str, user_id: UUID, expires_at: float) -> None:
+        if self.maxsize <= 0 or expires_at <= time.time():
+            return
+        key = _digest(token)
+        self._entries[key] = (user_id, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+token_cache = TokenCache()
@@ -0,0 +1,49 @@
+"""Bulk import campuses, buildings or rooms from a CSV or NDJSON file.
+
+    python -m app.cli.import_inventory rooms rooms.csv [--user admin] [--chunk-size 1000]
+"""
+import argparse
+import asyncio
+import sys
+
+from app.core.database import AsyncSessionLocal, engine
+from app.repositories.user_repo import UserRepository
+from app.services.import_service import IMPORT_CHUNK_SIZE, IMPORT_FORMATS, IMPORT_KINDS, ImportService, read_rows
+
+
+async def run(args) -> int:
+    fmt = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    async with AsyncSessionLocal() as session:
+        user = None
+        if args.user:
+            user = await UserRepository(session).get_by_username(args.user)
+            if user is None:
+                print(f"Unknown user: {args.user}", file=sys.stderr)
+                return 2
+
+        service = ImportService(session, user, chunk_size=args.chunk_size)
+        with open(args.path, "rb") as stream:
+            report = await service.import_rows(args.kind, read_rows(stream, fmt))
+    await engine.dispose()
+
+    for error in report.errors:
+        print(f"row {error.row}: {error.error}", file=sys.stderr)
+    print(
+        f"{report.kind}: {report.total} rows, {report.created} created, "
+        f"{report.skipped} skipped, {report.failed} failed"
+    )
+    return 1 if report.failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import UData inventory")
+    parser.add_argument("kind", choices=IMPORT_KINDS)
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=IMPORT_FORMATS)
+    parser.add_argument("--user", help="username recorded as created_by")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
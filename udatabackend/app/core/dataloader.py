@@ -0,0 +1,133 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+_LOADERS = "dataloaders"
+_LOCK = "dataloader_lock"
+
+
+class DataLoader:
+    """Batches lookups by key issued in the same event-loop tick and memoizes them.
+
+    The first `load` of a tick starts a task that calls `batch_load` with
+    every key requested before the loop gets back to it, so `asyncio.gather`
+    over many lookups costs a single query. Keys requested while a batch is
+    running go into the next one, run by the same task. Batches hold `lock`,
+    which loaders of one session share, so they never use the session
+    concurrently. Results, including misses, are kept until `clear`; a
+    memoized entity that has since left the session is fetched again.
+    `close` waits for the task, so it never outlives the session.
+    """
+
+    def __init__(self, batch_load: Callable[[set], Awaitable[dict]], lock: Optional[asyncio.Lock] = None):
+        self.batch_load = batch_load
+        self._lock = lock or asyncio.Lock()
+        self._memo: dict = {}
+        self._pending: dict = {}
+        self._pending_task: Optional[asyncio.Task] = None
+        self._generation = 0
+
+    async def load(self, key: Hashable) -> Any:
+        if key in self._memo:
+            obj = self._memo[key]
+            if obj is None or inspect(obj).persistent:
+                return obj
+            del self._memo[key]
+
+        future = self._pending.get(key)
+        if future is None:
+            if self._pending_task is None:
+                self._pending_task = asyncio.create_task(self._dispatch())
+            future = self._pending[key] = asyncio.get_running_loop().create_future()
+        return await future
+
+    async def load_many(self, keys: Iterable[Hashable]) -> dict:
+        keys = set(keys)
+        values = await asyncio.gather(*(self.load(key) for key in keys))
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    def clear(self) -> None:
+        """Forget the memoized results.
+
+        A batch already running is not cancelled, which would break the
+        session's connection mid-query; its rows still reach their callers
+        but are not memoized.
+        """
+        self._memo.clear()
+        self._generation += 1
+
+    async def close(self) -> None:
+        """Wait for the batch in flight, e.g. of a caller that was cancelled."""
+        if self._pending_task is not None:
+            await asyncio.gather(self._pending_task, return_exceptions=True)
+
+    async def _dispatch(self) -> None:
+        try:
+            async with self._lock:
+                while self._pending:
+                    batch, self._pending = self._pending, {}
+                    await self._load_batch(batch)
+        finally:
+            self._pending_task = None
+            # only left over when the task was cancelled from outside
+            batch, self._pending = self._pending, {}
+            for future in batch.values():
+                future.cancel()
+
+    async def _load_batch(self, batch: dict) -> None:
+        generation = self._generation
+        try:
+            found = await self.batch_load(set(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for key, future in batch.items():
+            value = found.get(key)
+            if generation == self._generation:
+                self._memo[key] = value
+            if not future.done():
+                future.set_result(value)
+
+
+def loader_for(session: AsyncSession, name: str, batch_load: Callable[[set], Awaitable[dict]]) -> DataLoader:
+    """The session's loader called `name`, created on first use.
+
+    Sessions are request-scoped, so loaders and their memos live for one
+    request.
+    """
+    loaders = session.info.setdefault(_LOADERS, {})
+    loader = loaders.get(name)
+    if loader is None:
+        lock = session.info.get(_LOCK)
+        if lock is None:
+            lock = session.info[_LOCK] = asyncio.Lock()
+        loader = loaders[name] = DataLoader(batch_load, lock)
+    return loader
+
+
+def clear_loader(session: AsyncSession, name: str) -> None:
+    loader = session.info.get(_LOADERS, {}).get(name)
+    if loader is not None:
+        loader.clear()
+
+
+async def close_loaders(session: AsyncSession) -> None:
+    """Wait for the session's loaders to finish; call before the session closes."""
+    for loader in session.info.get(_LOADERS, {}).values():
+        await loader.close()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_loaders(session: Session):
+    # a rollback expires the memoized entities, savepoint rollbacks included
+    for loader in session.info.get(_LOADERS, {}).values():
+        loader.clear()
@@ -0,0 +1,40 @@
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.schemas.base import AuditExpansion
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj) -> bytes:
+    """Encode plain rows (dicts, lists, UUIDs, datetimes, enums) to JSON bytes.
+
+    Uses orjson when it is installed and pydantic-core's encoder otherwise;
+    both produce the same output as the response models for these types.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return to_json(obj)
+
+
+def row_template(model: type[BaseModel]) -> dict:
+    """Field names of a response model in wire order, mapped to their defaults.
+
+    Copying the template and updating it with a row gives a dict that encodes
+    like the model would. Unexpanded audit users are left out, as the models
+    omit them too.
+    """
+    return {
+        name: None if field.is_required() else field.get_default()
+        for name, field in model.model_fields.items()
+        if name not in AuditExpansion.model_fields
+    }
+
+
+def fill(template: dict, row: dict) -> dict:
+    values = template.copy()
+    values.update(row)
+    return values
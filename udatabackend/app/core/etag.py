@@ -0,0 +1,49 @@
+import hashlib
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.dependencies import get_current_user
+from app.core.database import get_session
+from app.core.table_versions import get_versions
+from app.models.user import User
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        # If-None-Match uses the weak comparison
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def conditional_get(*tables: str):
+    """Dependency that validates a read against the versions of `tables`.
+
+    The ETag is derived from the per-table write counters (see
+    `app.core.table_versions`), so a matching `If-None-Match` is answered with
+    304 after one small query, before the endpoint touches the ORM or the
+    response models. Audit user expansion adds the users table.
+    """
+    async def check(
+            request: Request,
+            response: Response,
+            session: AsyncSession = Depends(get_session),
+            current_user: User = Depends(get_current_user)
+    ) -> str:
+        names = tables + ("users",) if request.query_params.get("expand") else tables
+        versions = await get_versions(session, names)
+        digest = hashlib.blake2b(repr((names, versions)).encode(), digest_size=8).hexdigest()
+        headers = {"ETag": f'"{digest}"', "Cache-Control": CACHE_CONTROL}
+
+        if _matches(request.headers.get("if-none-match"), headers["ETag"]):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+        return headers["ETag"]
+
+    return check
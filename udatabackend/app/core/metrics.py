@@ -0,0 +1,89 @@
+from bisect import bisect_left
+from typing import Sequence
+
+# Upper bounds in seconds, from sub-millisecond waits to multi-second stalls
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values, as Prometheus defines one."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """(upper bound, observations <= bound) pairs, ending with +Inf."""
+        pairs, total = [], 0
+        for bound, count in zip(self.buckets + (float("inf"),), self._counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def stats(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": {"+Inf" if bound == float("inf") else str(bound): count
+                        for bound, count in self.cumulative()},
+        }
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Exposition:
+    """Builds a scrape in the Prometheus text exposition format (version 0.0.4)."""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, namespace: str = "udata"):
+        self.namespace = namespace
+        self._lines: list[str] = []
+
+    def _header(self, name: str, kind: str, help: str) -> str:
+        name = f"{self.namespace}_{name}"
+        self._lines.append(f"# HELP {name} {help}")
+        self._lines.append(f"# TYPE {name} {kind}")
+        return name
+
+    def metric(self, name: str, kind: str, help: str, samples) -> None:
+        """A counter or gauge; `samples` is a value or an iterable of (labels, value)."""
+        name = self._header(name, kind, help)
+        if isinstance(samples, (int, float)):
+            samples = [({}, samples)]
+        for labels, value in samples:
+            self._lines.append(f"{name}{format_labels(labels)} {_number(value)}")
+
+    def histogram(self, name: str, help: str, samples) -> None:
+        """`samples` is an iterable of (labels, Histogram)."""
+        name = self._header(name, "histogram", help)
+        for labels, histogram in samples:
+            for bound, count in histogram.cumulative():
+                bucket = format_labels({**labels, "le": _number(float(bound))})
+                self._lines.append(f"{name}_bucket{bucket} {count}")
+            self._lines.append(f"{name}_sum{format_labels(labels)} {_number(histogram.sum)}")
+            self._lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
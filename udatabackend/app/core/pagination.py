@@ -0,0 +1,69 @@
+# app/core/pagination.py
+import base64
+import json
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from fastapi import Query
+
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "100"))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "1000"))
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class PageParams:
+    limit: int
+    cursor: Optional[str] = None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the keyset values of the last row of a page into an opaque token."""
+    payload = [
+        v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, uuid.UUID) else v
+        for v in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> list:
+    """Decode a cursor back into values typed after the keyset columns in `keys`."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError):
+        raise InvalidCursorError("Malformed cursor")
+
+    if not isinstance(payload, list) or len(payload) != len(keys):
+        raise InvalidCursorError("Cursor does not match this listing")
+
+    values = []
+    for value, key in zip(payload, keys):
+        python_type = key.type.python_type
+        try:
+            if value is None or isinstance(value, python_type):
+                values.append(value)
+            elif python_type is datetime:
+                values.append(datetime.fromisoformat(value))
+            else:
+                values.append(python_type(value))
+        except (ValueError, TypeError):
+            raise InvalidCursorError("Cursor does not match this listing")
+    return values
+
+
+def page_params(
+        limit: Optional[int] = Query(None, ge=1, description=f"Page size, capped at {MAX_PAGE_SIZE}"),
+        cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+) -> Optional[PageParams]:
+    """Keyset pagination is opt-in: without `limit` or `cursor` the full listing is returned."""
+    if limit is None and cursor is None:
+        return None
+    return PageParams(limit=min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE), cursor=cursor)
@@ -0,0 +1,83 @@
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from app.core.metrics import Histogram
+
+# Connection lifetimes run from seconds to the recycle interval and beyond
+LIFETIME_BUCKETS = (1, 5, 15, 60, 300, 900, 1800, 3600, 7200, 86400)
+
+
+class PoolMetrics:
+    """Checkout waits and connection lifetimes of the engine's pool.
+
+    Saturation shows up as checkout waits: a request that finds every
+    connection checked out and the overflow used up blocks until one is
+    returned or `pool_timeout` expires.
+    """
+
+    def __init__(self):
+        self.pool: Pool | None = None
+        self.checkout_wait = Histogram()
+        self.connection_lifetime = Histogram(LIFETIME_BUCKETS)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+
+    def attach(self, pool: Pool) -> None:
+        self.pool = pool
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "close", self._on_close)
+
+    def _on_connect(self, dbapi_connection, record):
+        self.connects += 1
+        record.info["connected_at"] = time.monotonic()
+
+    def _on_checkout(self, dbapi_connection, record, proxy):
+        self.checkouts += 1
+
+    def _on_close(self, dbapi_connection, record):
+        connected_at = record.info.pop("connected_at", None)
+        if connected_at is not None:
+            self.connection_lifetime.observe(time.monotonic() - connected_at)
+
+    def stats(self) -> dict:
+        pool = self.pool
+        stats = {
+            "pool": type(pool).__name__ if pool is not None else None,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "connects": self.connects,
+            "checkout_wait": self.checkout_wait.stats(),
+            "connection_lifetime": self.connection_lifetime.stats(),
+        }
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                # negative while the pool has not opened `size` connections yet
+                overflow=pool.overflow(),
+                max_overflow=pool._max_overflow,
+                timeout=pool.timeout(),
+            )
+        return stats
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that times every checkout, including the wait for a free slot."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+        finally:
+            pool_metrics.checkout_wait.observe(time.perf_counter() - started)
@@ -0,0 +1,212 @@
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# Add X-Query-* headers with each request's statement count, time and rows
+QUERY_STATS_HEADERS = os.getenv("QUERY_STATS_HEADERS", "false").lower() in ("1", "true")
+# A request running one statement this many times is counted as a likely N+1
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", "5"))
+
+_collectors: ContextVar[tuple] = ContextVar("query_collectors", default=())
+
+
+class QueryStats:
+    """Statements executed while this collector was active."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.rows = 0
+        self.max_rows = 0
+        self.rows_written = 0
+        self.statements: Counter = Counter()
+
+    @property
+    def max_repeats(self) -> int:
+        """Executions of the most repeated statement; high values point at N+1 loops."""
+        return max(self.statements.values(), default=0)
+
+    def record(self, statement: str, seconds: float, rows_written: int) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.rows_written += rows_written
+        self.statements[statement] += 1
+
+    def record_rows(self, rows: int) -> None:
+        """Rows a select returned; a large `max_rows` points at over-fetching."""
+        self.rows += rows
+        self.max_rows = max(self.max_rows, rows)
+
+
+@contextmanager
+def collect_queries() -> Iterator[QueryStats]:
+    """Attribute the statements run inside the block, in this context, to a new collector.
+
+    Collectors nest: a statement counts towards every active one.
+    """
+    stats = QueryStats()
+    token = _collectors.set(_collectors.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _collectors.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """Fail when the block runs more than `limit` statements.
+
+    For tests: wrap a call to the app through httpx's ASGI transport (or a
+    service call) so a new lazy load or per-row lookup fails the build:
+
+        with assert_max_queries(3):
+            await client.get("/rooms/", headers=auth)
+    """
+    with collect_queries() as stats:
+        yield stats
+    if stats.count > limit:
+        repeated = [f"{count}x {sql}" for sql, count in stats.statements.most_common(3)]
+        raise AssertionError(
+            f"{stats.count} queries executed, expected at most {limit}; most frequent:\n  "
+            + "\n  ".join(repeated)
+        )
+
+
+class RouteQueryStats:
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.seconds = 0.0
+        self.rows = 0
+        self.max_rows = 0
+        self.rows_written = 0
+        self.max_queries = 0
+        self.repeated = 0
+
+    def add(self, stats: QueryStats) -> None:
+        self.requests += 1
+        self.queries += stats.count
+        self.seconds += stats.seconds
+        self.rows += stats.rows
+        self.max_rows = max(self.max_rows, stats.max_rows)
+        self.rows_written += stats.rows_written
+        self.max_queries = max(self.max_queries, stats.count)
+        if stats.max_repeats >= QUERY_REPEAT_THRESHOLD:
+            self.repeated += 1
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "queries": self.queries,
+            "avg_queries": self.queries / self.requests if self.requests else 0.0,
+            "max_queries": self.max_queries,
+            "db_seconds": self.seconds,
+            "rows": self.rows,
+            "max_rows": self.max_rows,
+            "rows_written": self.rows_written,
+            "repeated_statement_requests": self.repeated,
+        }
+
+
+class QueryMetrics:
+    """Per-route totals of the statements requests ran, keyed by "METHOD /path/{param}"."""
+
+    def __init__(self):
+        self.routes: dict[str, RouteQueryStats] = {}
+
+    def add(self, route: str, stats: QueryStats) -> None:
+        self.routes.setdefault(route, RouteQueryStats()).add(stats)
+
+    def stats(self) -> dict:
+        return {route: totals.stats() for route, totals in sorted(self.routes.items())}
+
+
+query_metrics = QueryMetrics()
+
+
+def instrument(engine: AsyncEngine) -> None:
+    """Report every statement `engine` executes to the active collectors."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        if _collectors.get():
+            context._query_started = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _finish(conn, cursor, statement, parameters, context, executemany):
+        collectors = _collectors.get()
+        if not collectors:
+            return
+        seconds = time.perf_counter() - getattr(context, "_query_started", time.perf_counter())
+        # DB-API rowcount is only defined for writes; rows a SELECT returns are
+        # fetched after this event and are not counted
+        rows_written = max(cursor.rowcount, 0) if cursor.description is None else 0
+        for stats in collectors:
+            stats.record(statement, seconds, rows_written)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _count_rows(state: ORMExecuteState):
+    """Count the rows selects return, on the ORM side of the session.
+
+    The result is buffered (it is fully fetched by the async drivers anyway)
+    and handed on as a replacement. Streamed results, such as exports, are
+    left alone and not counted.
+    """
+    collectors = _collectors.get()
+    if not collectors or not state.is_select:
+        return None
+    options = state.execution_options
+    if options.get("yield_per") or options.get("stream_results"):
+        return None
+    frozen = state.invoke_statement().freeze()
+    rows = len(frozen.data)
+    for stats in collectors:
+        stats.record_rows(rows)
+    return frozen()
+
+
+def _route_name(scope) -> str:
+    route = scope.get("route")
+    return f"{scope['method']} {getattr(route, 'path', 'unmatched')}"
+
+
+class QueryStatsMiddleware:
+    """Collects the statements of each HTTP request into `query_metrics`.
+
+    Pure ASGI, so it adds no task or body buffering. With QUERY_STATS_HEADERS
+    on, the counts so far are added to the response headers; statements a
+    streaming body runs after the headers are sent still reach the metrics.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with collect_queries() as stats:
+            async def send_with_headers(message):
+                if message["type"] == "http.response.start" and QUERY_STATS_HEADERS:
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"x-query-count", str(stats.count).encode()),
+                        (b"x-query-time-ms", f"{stats.seconds * 1000:.2f}".encode()),
+                        (b"x-query-rows", str(stats.rows).encode()),
+                        (b"x-query-rows-written", str(stats.rows_written).encode()),
+                        (b"x-query-max-repeats", str(stats.max_repeats).encode()),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                query_metrics.add(_route_name(scope), stats)
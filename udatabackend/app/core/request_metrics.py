@@ -0,0 +1,95 @@
+import time
+
+from app.core.metrics import Histogram
+from app.core.startup import startup_report
+
+# Response sizes from an empty 304 to multi-megabyte exports
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+class RouteMetrics:
+    """Counters of one (route, method) pair.
+
+    Responses are counted per status class in a fixed list, so recording a
+    request allocates nothing.
+    """
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.responses = [0] * 6
+        self.latency = Histogram()
+        self.response_size = Histogram(SIZE_BUCKETS)
+
+    def record(self, status: int, seconds: float, size: int) -> None:
+        self.responses[min(status // 100, 5)] += 1
+        self.latency.observe(seconds)
+        self.response_size.observe(size)
+
+
+class RequestMetrics:
+    """Per-route request counts, latencies and response sizes of the app.
+
+    Routes are looked up by the matched route's path template, so the raw
+    URL (ids included) never becomes a label. Everything runs on the event
+    loop, so plain integer updates need no lock.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+        self._routes: dict = {}
+
+    def route(self, scope) -> RouteMetrics:
+        path = getattr(scope.get("route"), "path", "unmatched")
+        methods = self._routes.get(path)
+        if methods is None:
+            methods = self._routes[path] = {}
+        metrics = methods.get(scope["method"])
+        if metrics is None:
+            metrics = methods[scope["method"]] = RouteMetrics(scope["method"], path)
+        return metrics
+
+    def __iter__(self):
+        for methods in list(self._routes.values()):
+            yield from list(methods.values())
+
+
+request_metrics = RequestMetrics()
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware feeding `request_metrics`.
+
+    Latency runs from the request arriving to the last body chunk being
+    handed to the server, so streamed responses are measured in full.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_and_measure(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        request_metrics.in_flight += 1
+        try:
+            await self.app(scope, receive, send_and_measure)
+        finally:
+            request_metrics.in_flight -= 1
+            seconds = time.perf_counter() - started
+            request_metrics.route(scope).record(status, seconds, size)
+            if startup_report.first_request_seconds is None:
+                startup_report.first_request(seconds)
@@ -0,0 +1,204 @@
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, get_args, get_origin
+
+from fastapi import Depends, Request, Response
+from pydantic import TypeAdapter
+
+from app.core.encoding import dumps, fill, row_template
+from app.core.etag import CACHE_CONTROL, conditional_get
+
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "300"))
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Serialize list responses from plain column rows instead of response models
+FAST_SERIALIZATION = os.getenv("FAST_SERIALIZATION", "false").lower() in ("1", "true")
+
+
+class CacheBackend(ABC):
+    """Byte store behind the response cache.
+
+    The interface is the subset of a Redis client the cache needs, so a shared
+    Redis-compatible store can be plugged in to let several workers share
+    entries. Entries never need explicit invalidation: their keys embed the
+    table versions they were rendered at.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU bounded by the total size of the stored values."""
+
+    def __init__(self, max_bytes: int = RESPONSE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        self._pop(key)
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self.size += len(value)
+        while self.size > self.max_bytes:
+            self._pop(next(iter(self._entries)))
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[0])
+
+
+class ResponseCache:
+    """Serialized JSON bodies of read endpoints, keyed by URL and table versions.
+
+    Every repository write bumps its table's version (see
+    `app.core.table_versions`), which changes the keys of all responses built
+    from that table, so a write invalidates exactly those entries in every
+    worker. A `ttl` of 0 disables the cache.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None, ttl: float = RESPONSE_CACHE_TTL):
+        self.backend = backend or MemoryCacheBackend()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def set_backend(self, backend: CacheBackend) -> None:
+        self.backend = backend
+
+    async def get(self, key: str) -> bytes | None:
+        body = await self.backend.get(key)
+        if body is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return body
+
+    async def set(self, key: str, body: bytes) -> None:
+        await self.backend.set(key, body, self.ttl)
+
+    def stats(self) -> dict:
+        return {"ttl": self.ttl, "hits": self.hits, "misses": self.misses}
+
+
+response_cache = ResponseCache()
+
+_adapters: dict = {}
+_row_fields: dict = {}
+
+
+def _adapter(route) -> TypeAdapter:
+    adapter = _adapters.get(route.unique_id)
+    if adapter is None:
+        adapter = _adapters[route.unique_id] = TypeAdapter(route.response_model)
+    return adapter
+
+
+def _list_item_fields(route) -> Optional[dict]:
+    """Field names and defaults of the item model of a list route, in wire order.
+
+    None for routes that do not return a list.
+    """
+    if route.unique_id not in _row_fields:
+        fields = None
+        for option in get_args(route.response_model) or (route.response_model,):
+            if get_origin(option) is list:
+                fields = row_template(get_args(option)[0])
+                break
+        _row_fields[route.unique_id] = fields
+    return _row_fields[route.unique_id]
+
+
+def _encode_rows(result, fields: dict) -> bytes:
+    if isinstance(result, dict):
+        items = [fill(fields, row) for row in result["items"]]
+        return dumps({"items": items, "next_cursor": result["next_cursor"]})
+    return dumps([fill(fields, row) for row in result])
+
+
+class CachedRead:
+    """Serves a read endpoint's body from the response cache."""
+
+    def __init__(self, request: Request, etag: str):
+        self.request = request
+        self.headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        query = sorted(request.query_params.multi_items())
+        self.key = f"{etag}:{request.url.path}?{query}"
+
+        self._fields = None
+        if FAST_SERIALIZATION and not request.query_params.get("expand"):
+            self._fields = _list_item_fields(request.scope["route"])
+
+    @property
+    def fields(self) -> Optional[list[str]]:
+        """Columns to select for the fast path, or None to load entities.
+
+        Set for list routes without audit expansion when FAST_SERIALIZATION is
+        on; the endpoint passes it down to the repository, which then returns
+        plain dicts that are encoded without the response models.
+        """
+        return list(self._fields) if self._fields is not None else None
+
+    async def respond(self, produce: Callable[[], Awaitable]) -> Response:
+        """Return the cached body, or call `produce` and cache its serialized result.
+
+        The result is validated and dumped with the route's `response_model`,
+        exactly as FastAPI would, so the wire format is unchanged. Rows from
+        the fast path are encoded directly in the same field order.
+        """
+        def encode(result) -> bytes:
+            if self._fields is not None:
+                return _encode_rows(result, self._fields)
+            adapter = _adapter(self.request.scope["route"])
+            return adapter.dump_json(adapter.validate_python(result, from_attributes=True))
+
+        return await self._respond(produce, encode)
+
+    async def respond_plain(self, produce: Callable[[], Awaitable]) -> Response:
+        """Like `respond`, for endpoints whose result is already plain dicts in wire order.
+
+        The result is encoded with `dumps` as is, without the response model.
+        """
+        return await self._respond(produce, dumps)
+
+    async def _respond(self, produce: Callable[[], Awaitable], encode: Callable[[object], bytes]) -> Response:
+        body = await response_cache.get(self.key) if response_cache.enabled else None
+        if body is None:
+            body = encode(await produce())
+            if response_cache.enabled:
+                await response_cache.set(self.key, body)
+        return Response(content=body, media_type="application/json", headers=self.headers)
+
+
+def cached_read(*tables: str):
+    """Dependency for reads built from `tables`: conditional GET plus the response cache."""
+    validate = conditional_get(*tables)
+
+    async def dependency(request: Request, etag: str = Depends(validate)) -> CachedRead:
+        return CachedRead(request, etag)
+
+    return dependency
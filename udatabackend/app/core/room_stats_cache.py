@@ -0,0 +1,110 @@
+# app/core/room_stats_cache.py
+import os
+import time
+from collections import defaultdict
+from typing import Optional
+from uuid import UUID
+
+ROOM_STATS_CACHE_TTL = float(os.getenv("ROOM_STATS_CACHE_TTL", "300"))
+
+
+class RoomStatsCache:
+    """In-process summary of live rooms per (building, floor, status, type).
+
+    The summary is loaded with one GROUP BY query and then kept current by the
+    deltas RoomRepository reports once its creates, updates and soft deletes
+    commit, so stats requests cost O(groups). Writes that bypass those hooks (bulk imports,
+    set-based updates) call `invalidate`, and the TTL bounds how stale another
+    worker's writes can leave this one. A `ttl` of 0 disables the cache.
+    """
+
+    def __init__(self, ttl: float = ROOM_STATS_CACHE_TTL):
+        self.ttl = ttl
+        self._groups: Optional[dict] = None
+        self._campus_of: dict = {}
+        self._expires_at = 0.0
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def is_fresh(self) -> bool:
+        return self._groups is not None and time.monotonic() < self._expires_at
+
+    def begin_load(self) -> int:
+        return self._generation
+
+    def load(self, generation: int, rows) -> None:
+        """Install a summary read at `generation`, unless a write invalidated it meanwhile."""
+        if generation != self._generation:
+            return
+        groups = defaultdict(lambda: [0, 0])
+        campus_of = {}
+        for row in rows:
+            key = (row["building_id"], row["floor"], row["status"], row["type"])
+            groups[key][0] += row["rooms"]
+            groups[key][1] += row["capacity"]
+            campus_of[row["building_id"]] = row["campus_id"]
+        self._groups = groups
+        self._campus_of = campus_of
+        self._expires_at = time.monotonic() + self.ttl
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._groups = None
+
+    @staticmethod
+    def snapshot(room) -> tuple:
+        """The fields of `room` the summary depends on, taken before an update."""
+        return room.building_id, room.floor, room.status, room.type, room.capacity
+
+    def apply(self, snapshot: tuple, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one room, given by its snapshot."""
+        building_id, floor, status, type, capacity = snapshot
+        self._generation += 1
+        if self._groups is None:
+            return
+        if building_id not in self._campus_of:
+            # first room of a building we have not seen; its campus is unknown
+            self.invalidate()
+            return
+        group = self._groups[(building_id, floor, status, type)]
+        group[0] += sign
+        group[1] += sign * (capacity or 0)
+
+    def changed(self, before: tuple, after: tuple) -> None:
+        if after != before:
+            self.apply(before, -1)
+            self.apply(after, 1)
+
+    def aggregate(self, group_by: str, campus_id: Optional[UUID] = None,
+                  building_id: Optional[UUID] = None) -> list[dict]:
+        totals = defaultdict(lambda: [0, 0])
+        for (b_id, floor, status, type), (rooms, capacity) in self._groups.items():
+            if rooms == 0:
+                continue
+            c_id = self._campus_of[b_id]
+            if campus_id is not None and c_id != campus_id:
+                continue
+            if building_id is not None and b_id != building_id:
+                continue
+            if group_by == "campus":
+                key = (c_id, None, None)
+            elif group_by == "building":
+                key = (c_id, b_id, None)
+            else:
+                key = (c_id, b_id, floor)
+            total = totals[key + (status, type)]
+            total[0] += rooms
+            total[1] += capacity
+        return [
+            {
+                "campus_id": c_id, "building_id": b_id, "floor": floor,
+                "status": status, "type": type, "rooms": rooms, "capacity": capacity,
+            }
+            for (c_id, b_id, floor, status, type), (rooms, capacity) in totals.items()
+        ]
+
+
+room_stats_cache = RoomStatsCache()
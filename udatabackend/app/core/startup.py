@@ -0,0 +1,48 @@
+import logging
+import time
+from typing import Optional
+
+logger = logging.getLogger("uvicorn.error")
+
+
+class StartupReport:
+    """How long this worker took to become ready, logged and exported on /metrics.
+
+    `import_seconds` covers importing the application, `startup_seconds` the
+    startup hook (engine creation and the schema check) and
+    `first_request_seconds` the first request served, which also pays for
+    the first pool connection and cold caches.
+    """
+
+    def __init__(self):
+        self.import_seconds: Optional[float] = None
+        self.startup_seconds: Optional[float] = None
+        self.first_request_seconds: Optional[float] = None
+        self.schema_created: Optional[bool] = None
+
+    def imported(self, started: float) -> None:
+        self.import_seconds = time.perf_counter() - started
+
+    def started(self, started: float, schema_created: bool) -> None:
+        self.startup_seconds = time.perf_counter() - started
+        self.schema_created = schema_created
+        logger.info(
+            "Startup: imports %.3fs, startup hook %.3fs (%s)",
+            self.import_seconds or 0.0, self.startup_seconds,
+            "schema created" if schema_created else "schema current",
+        )
+
+    def first_request(self, seconds: float) -> None:
+        self.first_request_seconds = seconds
+        logger.info("Startup: first request served in %.3fs", seconds)
+
+    def stats(self) -> dict:
+        return {
+            "import_seconds": self.import_seconds,
+            "startup_seconds": self.startup_seconds,
+            "first_request_seconds": self.first_request_seconds,
+            "schema_created": self.schema_created,
+        }
+
+
+startup_report = StartupReport()
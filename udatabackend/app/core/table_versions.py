@@ -0,0 +1,55 @@
+from typing import Sequence
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.table_version import TableVersion
+
+_CHANGED_TABLES = "changed_tables"
+
+
+def mark_changed(session: AsyncSession, table: str) -> None:
+    """Record that the session's transaction writes to `table`.
+
+    The table's version is bumped once, right before the transaction commits,
+    so it changes atomically with the data. The bump locks the table's
+    `table_version` row until the commit, so write transactions on one table
+    commit one after another for that last stretch; keep them short.
+    """
+    session.info.setdefault(_CHANGED_TABLES, set()).add(table)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_versions(session: Session):
+    if session.get_nested_transaction() is not None:
+        return
+    tables = sorted(session.info.pop(_CHANGED_TABLES, ()))
+    if not tables:
+        return
+    # one upsert, so two first writers to a table cannot both INSERT its row;
+    # sorted names take the row locks in the same order in every transaction
+    dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+    session.execute(
+        dialect.insert(TableVersion)
+        .values([{"name": table, "version": 1} for table in tables])
+        .on_conflict_do_update(index_elements=[TableVersion.name],
+                               set_={"version": TableVersion.version + 1})
+    )
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session):
+    if session.get_nested_transaction() is not None:
+        return
+    session.info.pop(_CHANGED_TABLES, None)
+
+
+async def get_versions(session: AsyncSession, tables: Sequence[str]) -> tuple[int, ...]:
+    """Current versions of `tables`, in order, with one primary-key lookup."""
+    result = await session.execute(
+        select(TableVersion.name, TableVersion.version).where(TableVersion.name.in_(tables))
+    )
+    versions = dict(result.all())
+    return tuple(versions.get(table, 0) for table in tables)
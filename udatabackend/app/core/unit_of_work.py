@@ -0,0 +1,88 @@
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Callable
+
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import get_session
+
+_AFTER_COMMIT = "after_commit_callbacks"
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run `callback` once the session's transaction commits; drop it on rollback.
+
+    Repositories use this for in-process caches, so they are only updated with
+    changes that were actually committed.
+    """
+    session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session):
+    if session.get_nested_transaction() is not None:
+        # a savepoint was released; the outer transaction is still open
+        return
+    for callback in session.info.pop(_AFTER_COMMIT, []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit(session: Session):
+    if session.get_nested_transaction() is not None:
+        return
+    session.info.pop(_AFTER_COMMIT, None)
+
+
+class UnitOfWork:
+    """One transaction around a request or a batch of mutations.
+
+    Repositories only flush; the unit of work commits once when its block
+    exits normally and rolls back when it raises.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+
+    async def commit(self) -> None:
+        await self.session.commit()
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+        # no rollback event fires if the transaction had not begun yet
+        self.session.info.pop(_AFTER_COMMIT, None)
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncGenerator[AsyncSession, None]:
+        """Run a block in a SAVEPOINT; if it raises, only its changes are undone."""
+        callbacks = self.session.info.setdefault(_AFTER_COMMIT, [])
+        registered = len(callbacks)
+        try:
+            async with self.session.begin_nested():
+                yield self.session
+        except BaseException:
+            del callbacks[registered:]
+            raise
+
+
+async def get_unit_of_work(
+        session: AsyncSession = Depends(get_session)
+) -> AsyncGenerator[UnitOfWork, None]:
+    """Wrap the request's session in a unit of work.
+
+    Declare it with `Depends(get_unit_of_work, scope="function")` so the commit
+    happens when the endpoint returns, before the response is sent.
+    """
+    async with UnitOfWork(session) as uow:
+        yield uow
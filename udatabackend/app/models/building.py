@@ -2,13 +2,15 @@ import uuid
 from sqlalchemy import String, Enum, Integer, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.enums import BuildingStatus, BuildingType
-from app.models.mixins import AuditableMixin
+from app.models.mixins import AuditableMixin, live_index
 from app.core.base import BaseModel
 
 class Building(BaseModel, AuditableMixin):
     __tablename__ = "building"
     __table_args__ = (
         UniqueConstraint("campus_id", "building_no"),
+        live_index("ix_building_campus_live", "campus_id", "created_at", "id"),
+        live_index("ix_building_live", "created_at", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
@@ -20,7 +22,7 @@ class Building(BaseModel, AuditableMixin):
     status: Mapped[BuildingStatus] = mapped_column(Enum(BuildingStatus), default=BuildingStatus.ACTIVE)
 
     campus = relationship("Campus", back_populates="buildings")
-    rooms = relationship("Room", back_populates="building", lazy="selectin")
+    rooms = relationship("Room", back_populates="building", lazy="noload")
     
     @property
     def building_name(self) -> str:
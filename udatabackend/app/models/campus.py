@@ -3,10 +3,13 @@ from sqlalchemy import String, Enum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.base import BaseModel
 from app.models.enums import CampusStatus
-from app.models.mixins import AuditableMixin
+from app.models.mixins import AuditableMixin, live_index
 
 class Campus(BaseModel, AuditableMixin):
     __tablename__ = "campus"
+    __table_args__ = (
+        live_index("ix_campus_live", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     code: Mapped[str] = mapped_column(String(50), unique=True)
@@ -14,4 +17,4 @@ class Campus(BaseModel, AuditableMixin):
     address: Mapped[str | None] = mapped_column(String(255))
     status: Mapped[CampusStatus] = mapped_column(Enum(CampusStatus), default=CampusStatus.ACTIVE)
 
-    buildings = relationship("Building", back_populates="campus", lazy="selectin")
+    buildings = relationship("Building", back_populates="campus", lazy="noload")
@@ -1,8 +1,18 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey
+from sqlalchemy import DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship, declared_attr
 
+def live_index(name: str, *columns: str, **kwargs) -> Index:
+    """Partial index over the rows that are not soft-deleted.
+
+    Every repository query filters on `deleted_at IS NULL`; both Postgres and
+    SQLite support the partial form, which keeps archived rows out of the index.
+    """
+    where = text("deleted_at IS NULL")
+    return Index(name, *columns, postgresql_where=where, sqlite_where=where, **kwargs)
+
+
 class AuditableMixin:
     @declared_attr
     def created_at(cls) -> Mapped[datetime]:
@@ -24,10 +34,12 @@ class AuditableMixin:
     def updated_by_id(cls) -> Mapped[uuid.UUID | None]:
         return mapped_column(ForeignKey("users.id"), nullable=True)
 
+    # Audit users are not loaded with the row; responses only need the *_by_id
+    # columns, and ?expand= resolves them in one batched query when asked for.
     @declared_attr
     def created_by(cls):
-        return relationship("User", foreign_keys=[cls.created_by_id], lazy="joined")
+        return relationship("User", foreign_keys=[cls.created_by_id], lazy="noload")
 
     @declared_attr
     def updated_by(cls):
-        return relationship("User", foreign_keys=[cls.updated_by_id], lazy="joined")
+        return relationship("User", foreign_keys=[cls.updated_by_id], lazy="noload")
@@ -5,12 +5,17 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.base import BaseModel
 from app.models.enums import RoomStatus, RoomType
-from app.models.mixins import AuditableMixin
+from app.models.mixins import AuditableMixin, live_index
 
 class Room(BaseModel, AuditableMixin):
     __tablename__ = "room"
     __table_args__ = (
         UniqueConstraint("building_id", "room_no"),
+        live_index("ix_room_building_live", "building_id", "created_at", "id"),
+        live_index("ix_room_live", "created_at", "id"),
+        live_index("ix_room_status_type_live", "status", "type"),
+        live_index("ix_room_building_floor_live", "building_id", "floor"),
+        live_index("ix_room_no_live", "room_no", postgresql_ops={"room_no": "text_pattern_ops"}),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
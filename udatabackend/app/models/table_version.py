@@ -0,0 +1,10 @@
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.core.base import BaseModel
+
+class TableVersion(BaseModel):
+    """Write counter per table, bumped in the transaction of every change to it."""
+    __tablename__ = "table_version"
+
+    name: Mapped[str] = mapped_column(String(63), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
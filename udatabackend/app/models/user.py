@@ -3,11 +3,14 @@ from sqlalchemy import String, Enum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.core.base import BaseModel
 from app.models.enums import UserStatus
-from app.models.mixins import AuditableMixin
+from app.models.mixins import AuditableMixin, live_index
 from app.models.enums import Role
 
 class User(BaseModel, AuditableMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        live_index("ix_users_live", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column( primary_key=True, default=uuid.uuid4 )
     full_name: Mapped[str | None] = mapped_column(String(255))
@@ -1,31 +1,284 @@
 from datetime import datetime
-from typing import Generic, TypeVar, Type
+from typing import AsyncIterator, Generic, TypeVar, Type, Optional, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, insert, update, tuple_, inspect
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import select
+from sqlalchemy.sql.base import ExecutableOption
+
+from app.core.dataloader import DataLoader, clear_loader, loader_for
+from app.core.pagination import PageParams, encode_cursor, decode_cursor
+from app.core.table_versions import mark_changed
 
 ModelType = TypeVar("ModelType", bound=DeclarativeBase)
 
 class BaseRepository(Generic[ModelType]):
+    # Columns of the model's unique constraint, used as the ON CONFLICT target.
+    natural_key: tuple[str, ...] = ()
+    # Sort names accepted by list filters besides "created_at", mapped to the
+    # column or NULL-free expression they order by.
+    sortable: dict = {}
+
     def __init__(self, model: Type[ModelType], session: AsyncSession):
         self.model = model
         self.session = session
 
-    async def get_by_id(self, id):
+    def _select(self, load: Sequence[ExecutableOption] = (), fields: Optional[Sequence[str]] = None):
+        """Entity select with the caller's loader options.
+
+        Collection relationships are `noload` on the models, so a query only
+        hydrates the relationships its caller asks for here. When `fields` is
+        given, the plain columns of that name are selected instead of the
+        entity and list methods return plain dicts.
+        """
+        if fields is not None:
+            table = self.model.__table__
+            return select(*(table.c[name] for name in fields if name in table.c))
+        return select(self.model).options(*load)
+
+    def _selects_entity(self, stmt) -> bool:
+        return stmt.column_descriptions[0]["expr"] is self.model
+
+    @property
+    def loader(self) -> DataLoader:
+        """Request-scoped batching loader for plain lookups by id.
+
+        Writes through this repository clear it, so it never serves a row
+        from before a change made in the same request.
+        """
+        return loader_for(self.session, self.model.__tablename__, self._fetch_many)
+
+    async def get_by_id(self, id, load: Sequence[ExecutableOption] = ()):
+        """A live row by id, or None.
+
+        Without loader options the lookup goes through `loader`: concurrent
+        lookups share one `IN` query and repeated ones cost nothing.
+        """
+        if not load:
+            return await self.loader.load(id)
         stmt = (
-            select(self.model)
+            self._select(load)
             .where(
                 self.model.id == id,
                 self.model.deleted_at.is_(None)
             )
         )
         result = await self.session.execute(stmt)
-        return result.scalars().unique().first()
+        return result.scalars().first()
+
+    async def get_deleted(self, id, load: Sequence[ExecutableOption] = ()):
+        """A soft-deleted row by id, for restoring it."""
+        stmt = (
+            self._select(load)
+            .where(
+                self.model.id == id,
+                self.model.deleted_at.is_not(None)
+            )
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
+    async def restore(self, obj: ModelType, **values) -> ModelType:
+        return await self.update(obj, {**values, "deleted_at": None})
+
+    async def get_many(self, ids) -> dict:
+        """Fetch several rows by primary key in a single `IN` query, keyed by id.
+
+        Rows this request already looked up are served from `loader`.
+        """
+        return await self.loader.load_many(ids)
+
+    async def _fetch_many(self, ids) -> dict:
+        ids = set(ids)
+        if not ids:
+            return {}
+        stmt = self._select().where(self.model.id.in_(ids), self.model.deleted_at.is_(None))
+        result = await self.session.execute(stmt)
+        return {obj.id: obj for obj in result.scalars()}
+
+    def _changed(self) -> None:
+        mark_changed(self.session, self.model.__tablename__)
+        clear_loader(self.session, self.model.__tablename__)
+
+    def _column_values(self, data: dict) -> dict:
+        columns = self.model.__table__.c
+        return {key: value for key, value in data.items() if key in columns}
+
+    async def create(self, obj: ModelType) -> ModelType:
+        """Persist a new entity with one `INSERT ... RETURNING`.
+
+        The returned entity is populated from the RETURNING row (defaults
+        included), so nothing is read back after the commit. Dialects without
+        INSERT RETURNING fall back to a plain ORM flush; every default is
+        generated on the Python side, so nothing has to be read back either.
+        """
+        self._changed()
+        if not self.session.bind.dialect.insert_returning:
+            self.session.add(obj)
+            await self.session.flush()
+            return obj
+
+        values = self._column_values(inspect(obj).dict)
+        stmt = insert(self.model).values(**values).returning(self.model)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def update(self, obj: ModelType, data: dict) -> ModelType:
+        """Apply `data` with one `UPDATE ... RETURNING`.
+
+        `obj` is refreshed in place from the returned row. Keys that are not
+        columns of the model are ignored.
+        """
+        self._changed()
+        values = self._column_values(data)
+        if not self.session.bind.dialect.update_returning:
+            for key, value in values.items():
+                setattr(obj, key, value)
+            await self.session.flush()
+            return obj
+
+        stmt = (
+            update(self.model)
+            .where(self.model.id == obj.id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def soft_delete(self, obj: ModelType, **values) -> ModelType:
+        return await self.update(obj, {**values, "deleted_at": datetime.utcnow()})
+
+    async def update_where(self, values: dict, *where) -> int:
+        """Apply `values` to every row matching `where` with one set-based UPDATE.
+
+        Entities already loaded in the session are not synchronized. Returns
+        the number of rows updated.
+        """
+        self._changed()
+        stmt = (
+            update(self.model)
+            .where(*where)
+            .values(**self._column_values(values))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount
+
+    async def existing_ids(self, ids) -> set:
+        """Subset of `ids` that belong to live (not soft-deleted) rows."""
+        ids = set(ids)
+        if not ids:
+            return set()
+        stmt = select(self.model.id).where(self.model.id.in_(ids), self.model.deleted_at.is_(None))
+        result = await self.session.execute(stmt)
+        return set(result.scalars())
+
+    def _insert(self):
+        """INSERT construct of the session's dialect, which supports ON CONFLICT."""
+        if self.session.bind.dialect.name == "postgresql":
+            return postgresql.insert(self.model)
+        return sqlite.insert(self.model)
+
+    async def bulk_insert(self, rows: list[dict]) -> list:
+        """Insert `rows` with multi-row INSERT statements.
+
+        The rows are passed as executemany parameters, which SQLAlchemy sends as
+        batched multi-row `INSERT ... VALUES` ("insertmanyvalues") from one
+        cached compiled statement. Rows colliding with `natural_key` are
+        skipped; the natural keys of the rows actually inserted are returned.
+        """
+        if not rows:
+            return []
+        self._changed()
+        key_columns = [getattr(self.model, name) for name in self.natural_key]
+        stmt = (
+            self._insert()
+            .on_conflict_do_nothing(index_elements=key_columns)
+            .returning(*key_columns)
+        )
+        result = await self.session.execute(stmt, rows)
+        return [tuple(row) for row in result.all()]
+
+    async def list_all(self, page: Optional[PageParams] = None, load: Sequence[ExecutableOption] = (), filters=None,
+                       fields: Optional[Sequence[str]] = None):
+        stmt = (self._select(load, fields).where(self.model.deleted_at.is_(None)))
+        return await self._list(stmt, page, filters)
+
+    def apply_filters(self, stmt, filters):
+        """Hook for repositories whose listings accept a filter schema."""
+        return stmt
+
+    def sort_keys(self, sort: Optional[str] = None) -> tuple[tuple, bool]:
+        """Keyset columns and direction for a sort name such as "floor" or "-floor"."""
+        name = sort or "created_at"
+        descending = name.startswith("-")
+        name = name.lstrip("-")
+        column = self.model.created_at if name == "created_at" else self.sortable[name]
+        return (column, self.model.id), descending
+
+    async def _list(self, stmt, page: Optional[PageParams] = None, filters=None):
+        """Shared tail of the list methods: filters, sort order and pagination."""
+        if filters is not None:
+            stmt = self.apply_filters(stmt, filters)
+        keys, descending = self.sort_keys(getattr(filters, "sort", None))
+        if page is not None:
+            return await self.paginate(stmt, page, keys, descending)
+        if filters is not None:
+            stmt = stmt.order_by(*(key.desc() if descending else key for key in keys))
+        if not self._selects_entity(stmt):
+            return await self._rows(stmt)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def _rows(self, stmt) -> list[dict]:
+        """Run a column select and return its rows as plain dicts."""
+        result = await self.session.execute(stmt)
+        names = list(result.keys())
+        return [dict(zip(names, row)) for row in result]
+
+    def export_select(self, flatten: bool = False):
+        """Columns of the live rows for exports; repositories add parent columns when flattened."""
+        columns = [c for c in self.model.__table__.c if c.key != "deleted_at"]
+        return select(*columns).where(self.model.deleted_at.is_(None))
+
+    async def stream(self, stmt, batch_size: int = 1000) -> AsyncIterator[Sequence]:
+        """Yield result rows in batches from a server-side cursor.
+
+        Only one batch is held in memory at a time, however large the result.
+        """
+        result = await self.session.stream(stmt.execution_options(yield_per=batch_size))
+        async for rows in result.mappings().partitions():
+            yield rows
+
+    async def paginate(self, stmt, page: PageParams, keys=None, descending: bool = False) -> dict:
+        """Run `stmt` as a keyset page ordered by `keys` (default `(created_at, id)`).
+
+        The keyset values are selected alongside the entity so the next cursor is
+        taken from the last row without re-deriving it in Python.
+        """
+        keys = tuple(keys or (self.model.created_at, self.model.id))
+
+        if page.cursor is not None:
+            after = tuple(decode_cursor(page.cursor, keys))
+            stmt = stmt.where(tuple_(*keys) < after if descending else tuple_(*keys) > after)
 
-    async def list_all(self):
-        stmt = (select(self.model).where(self.model.deleted_at.is_(None)))
+        entity = self._selects_entity(stmt)
+        width = 1 if entity else len(stmt.selected_columns)
+        order = [key.desc() if descending else key for key in keys]
+        stmt = stmt.add_columns(*keys).order_by(*order).limit(page.limit + 1)
         result = await self.session.execute(stmt)
-        return result.scalars().unique().all()
+        names = list(result.keys())[:width]
+        rows = result.all()
 
+        next_cursor = None
+        if len(rows) > page.limit:
+            rows = rows[:page.limit]
+            next_cursor = encode_cursor(rows[-1][width:])
 
+        if entity:
+            items = [row[0] for row in rows]
+        else:
+            items = [dict(zip(names, row)) for row in rows]
+        return {"items": items, "next_cursor": next_cursor}
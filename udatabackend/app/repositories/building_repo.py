@@ -1,24 +1,52 @@
-from sqlalchemy import select
+from sqlalchemy import select, exists, tuple_, func
+from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
+from typing import Optional, Sequence
+from app.core.pagination import PageParams
 from app.models.building import Building
+from app.models.campus import Campus
+from app.models.room import Room
 from app.repositories.base import BaseRepository
+from app.repositories.room_repo import RoomRepository
 
 
 class BuildingRepository(BaseRepository[Building]):
+    # Loader options for BuildingWithRooms; soft-deleted rooms are left out.
+    WITH_ROOMS = (selectinload(Building.rooms.and_(Room.deleted_at.is_(None))),)
+
+    natural_key = ("campus_id", "building_no")
+    sortable = {
+        "building_no": Building.building_no,
+        "floors": func.coalesce(Building.floors, -1),
+    }
+
     def __init__(self, session: AsyncSession):
         super().__init__(Building, session)
 
-    async def list_buildings_by_campus(self, campus_id):
+    async def list_buildings_by_campus(self, campus_id, page: Optional[PageParams] = None, load: Sequence = (), filters=None,
+                                       fields: Optional[Sequence[str]] = None):
         stmt = (
-            select(Building)
+            self._select(load, fields)
             .where(
                 Building.campus_id == campus_id,
                 Building.deleted_at.is_(None)
             )
         )
-        result = await self.session.execute(stmt)
-        return result.scalars().unique().all()
+        return await self._list(stmt, page, filters)
+
+    def apply_filters(self, stmt, filters):
+        if filters.campus_id is not None:
+            stmt = stmt.where(Building.campus_id == filters.campus_id)
+        if filters.status is not None:
+            stmt = stmt.where(Building.status == filters.status)
+        if filters.type is not None:
+            stmt = stmt.where(Building.type == filters.type)
+        if filters.prefix is not None:
+            stmt = stmt.where(Building.prefix == filters.prefix)
+        if filters.building_no:
+            stmt = stmt.where(Building.building_no.startswith(filters.building_no, autoescape=True))
+        return stmt
 
     async def exists_in_campus(self, campus_id, building_no: str) -> bool:
         stmt = (
@@ -32,20 +60,56 @@ class BuildingRepository(BaseRepository[Building]):
         result = await self.session.execute(stmt)
         return result.scalar() is not None
 
-    async def create(self, building: Building):
-        self.session.add(building)
-        await self.session.commit()
-        await self.session.refresh(building)
-        return building
-
-    async def update(self, building: Building, data: dict):
-        for key, value in data.items():
-            setattr(building, key, value)
-        await self.session.commit()
-        await self.session.refresh(building)
-        return building
-
-    async def soft_delete(self, building: Building):
-        building.deleted_at = datetime.utcnow()
-        await self.session.commit()
-        return building
+    async def has_rooms(self, building_id) -> bool:
+        stmt = select(
+            exists().where(Room.building_id == building_id, Room.deleted_at.is_(None))
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar()
+
+    async def soft_delete_cascade(self, building: Building, **values) -> Building:
+        """Soft-delete the building and its live rooms with one shared `deleted_at`.
+
+        The shared timestamp lets `restore_cascade` bring back exactly the rooms
+        deleted along with the building.
+        """
+        values = {**values, "deleted_at": datetime.utcnow()}
+        await RoomRepository(self.session).update_where(
+            values, Room.building_id == building.id, Room.deleted_at.is_(None)
+        )
+        return await self.update(building, values)
+
+    async def restore_cascade(self, building: Building, **values) -> Building:
+        await RoomRepository(self.session).update_where(
+            {**values, "deleted_at": None},
+            Room.building_id == building.id,
+            Room.deleted_at == building.deleted_at
+        )
+        return await self.restore(building, **values)
+
+    def export_select(self, flatten: bool = False):
+        stmt = super().export_select()
+        if flatten:
+            stmt = (
+                stmt.join(Campus, Building.campus_id == Campus.id)
+                .add_columns(Campus.code.label("campus_code"), Campus.name.label("campus_name"))
+            )
+        return stmt.order_by(Building.created_at, Building.id)
+
+    async def ids_by_campus_code(self, keys) -> dict:
+        """Resolve `(campus_code, building_no)` pairs to building ids in one query."""
+        keys = set(keys)
+        if not keys:
+            return {}
+        stmt = (
+            select(Campus.code, Building.building_no, Building.id)
+            .join(Campus, Building.campus_id == Campus.id)
+            .where(
+                tuple_(Campus.code, Building.building_no).in_(keys),
+                Building.deleted_at.is_(None),
+                Campus.deleted_at.is_(None)
+            )
+        )
+        result = await self.session.execute(stmt)
+        return {(code, building_no): id for code, building_no, id in result.all()}
+
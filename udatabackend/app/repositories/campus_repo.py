@@ -1,41 +1,120 @@
 # repositories/campus_repo.py
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, exists
+from sqlalchemy.orm import selectinload
+from app.models.building import Building
 from app.models.campus import Campus
-from typing import Optional
+from app.models.room import Room
+from typing import Optional, Sequence
+from datetime import datetime
 from uuid import UUID
 from app.repositories.base import BaseRepository
+from app.repositories.building_repo import BuildingRepository
+from app.models.enums import RoomStatus
+from app.repositories.room_repo import RoomRepository
 
 class CampusRepository(BaseRepository[Campus]):
+    natural_key = ("code",)
+
+    # Loader options for the nested CampusWithBuildings schema; soft-deleted
+    # buildings and rooms are left out.
+    WITH_BUILDINGS = (
+        selectinload(Campus.buildings.and_(Building.deleted_at.is_(None)))
+        .selectinload(Building.rooms.and_(Room.deleted_at.is_(None))),
+    )
+
     def __init__(self, session: AsyncSession):
         super().__init__(Campus, session)
 
+    async def get_by_code(self, code: str) -> Optional[Campus]:
+        result = await self.session.execute(
+            self._select().where(self.model.code == code)
+        )
+        return result.scalars().first()
 
-    async def create(self, campus: Campus) -> Campus:
-        self.session.add(campus)
-        await self.session.commit()
-        await self.session.refresh(campus)
-        return campus
 
-    async def update(self, campus: Campus, data: dict):
-        for key, value in data.items():
-            setattr(campus, key, value)
-        await self.session.commit()
-        await self.session.refresh(campus)
+    async def has_buildings(self, campus_id) -> bool:
+        stmt = select(
+            exists().where(Building.campus_id == campus_id, Building.deleted_at.is_(None))
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar()
 
-        return campus
+    async def soft_delete_cascade(self, campus: Campus, **values) -> Campus:
+        """Soft-delete the campus with its live buildings and rooms.
 
-    async def get_by_code(self, code: str) -> Optional[Campus]:
-        result = await self.session.execute(
-            select(self.model).where(self.model.code == code)
+        Three set-based UPDATEs stamp one shared `deleted_at` on the whole
+        subtree; nothing below the campus is loaded.
+        """
+        values = {**values, "deleted_at": datetime.utcnow()}
+        buildings = select(Building.id).where(
+            Building.campus_id == campus.id, Building.deleted_at.is_(None)
+        )
+        await RoomRepository(self.session).update_where(
+            values, Room.building_id.in_(buildings), Room.deleted_at.is_(None)
+        )
+        await BuildingRepository(self.session).update_where(
+            values, Building.campus_id == campus.id, Building.deleted_at.is_(None)
+        )
+        return await self.update(campus, values)
+
+    async def restore_cascade(self, campus: Campus, **values) -> Campus:
+        """Restore the campus and the buildings and rooms deleted together with it."""
+        restored = {**values, "deleted_at": None}
+        buildings = select(Building.id).where(
+            Building.campus_id == campus.id, Building.deleted_at == campus.deleted_at
+        )
+        await RoomRepository(self.session).update_where(
+            restored, Room.building_id.in_(buildings), Room.deleted_at == campus.deleted_at
+        )
+        await BuildingRepository(self.session).update_where(
+            restored, Building.campus_id == campus.id, Building.deleted_at == campus.deleted_at
+        )
+        return await self.restore(campus, **values)
+
+    async def tree_rows(self, campus_fields: Sequence[str], building_fields: Sequence[str],
+                        room_fields: Sequence[str], campus_id: Optional[UUID] = None,
+                        room_status: Optional[RoomStatus] = None) -> tuple[list, list, list]:
+        """Live campuses, buildings and rooms as plain dicts, one flat query per level.
+
+        Buildings and rooms are restricted with IN subqueries on the level
+        above, so the three queries cost the same however many campuses match;
+        the caller groups them into a tree.
+        """
+        campuses = self._select(fields=campus_fields).where(Campus.deleted_at.is_(None))
+        if campus_id is not None:
+            campuses = campuses.where(Campus.id == campus_id)
+        buildings = (
+            BuildingRepository(self.session)._select(fields=building_fields)
+            .where(
+                Building.campus_id.in_(campuses.with_only_columns(Campus.id)),
+                Building.deleted_at.is_(None)
+            )
+        )
+        rooms = (
+            RoomRepository(self.session)._select(fields=room_fields)
+            .where(
+                Room.building_id.in_(buildings.with_only_columns(Building.id)),
+                Room.deleted_at.is_(None)
+            )
+        )
+        if room_status is not None:
+            rooms = rooms.where(Room.status == room_status)
+
+        return (
+            await self._rows(campuses.order_by(Campus.created_at, Campus.id)),
+            await self._rows(buildings.order_by(Building.created_at, Building.id)),
+            await self._rows(rooms.order_by(Room.created_at, Room.id)),
         )
-        return result.scalars().first()
 
+    def export_select(self, flatten: bool = False):
+        return super().export_select().order_by(Campus.created_at, Campus.id)
 
-    async def soft_delete(self, campus: Campus) -> Campus:
-        from datetime import datetime
-        campus.deleted_at = datetime.utcnow()
-        await self.session.commit()
-        await self.session.refresh(campus)
-        return campus
+    async def ids_by_code(self, codes) -> dict:
+        codes = set(codes)
+        if not codes:
+            return {}
+        stmt = select(Campus.code, Campus.id).where(Campus.code.in_(codes), Campus.deleted_at.is_(None))
+        result = await self.session.execute(stmt)
+        return dict(result.all())
 
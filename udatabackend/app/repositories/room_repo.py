@@ -1,26 +1,110 @@
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime
+from typing import Optional, Sequence
 from uuid import UUID
 
+from app.core.pagination import PageParams
+from app.core.room_stats_cache import room_stats_cache
+from app.core.unit_of_work import after_commit
+from app.models.building import Building
+from app.models.campus import Campus
 from app.models.room import Room
 from app.repositories.base import BaseRepository
 
 
 class RoomRepository(BaseRepository[Room]):
+    natural_key = ("building_id", "room_no")
+    sortable = {
+        "room_no": func.coalesce(Room.room_no, ""),
+        "floor": func.coalesce(Room.floor, -2 ** 31),
+        "capacity": func.coalesce(Room.capacity, -1),
+    }
+
     def __init__(self, session: AsyncSession):
         super().__init__(Room, session)
 
-    async def list_by_building(self, building_id: UUID):
+    async def list_by_building(self, building_id: UUID, page: Optional[PageParams] = None, load: Sequence = (), filters=None,
+                               fields: Optional[Sequence[str]] = None):
         stmt = (
-            select(Room)
+            self._select(load, fields)
             .where(
                 Room.building_id == building_id,
                 Room.deleted_at.is_(None)
             )
         )
+        return await self._list(stmt, page, filters)
+
+    def apply_filters(self, stmt, filters):
+        if filters.building_id is not None:
+            stmt = stmt.where(Room.building_id == filters.building_id)
+        if filters.campus_id is not None:
+            stmt = stmt.where(Room.building_id.in_(
+                select(Building.id).where(
+                    Building.campus_id == filters.campus_id,
+                    Building.deleted_at.is_(None)
+                )
+            ))
+        if filters.status is not None:
+            stmt = stmt.where(Room.status == filters.status)
+        if filters.type is not None:
+            stmt = stmt.where(Room.type == filters.type)
+        if filters.floor_min is not None:
+            stmt = stmt.where(Room.floor >= filters.floor_min)
+        if filters.floor_max is not None:
+            stmt = stmt.where(Room.floor <= filters.floor_max)
+        if filters.min_capacity is not None:
+            stmt = stmt.where(Room.capacity >= filters.min_capacity)
+        if filters.prefix is not None:
+            stmt = stmt.where(Room.prefix == filters.prefix)
+        if filters.room_no:
+            stmt = stmt.where(Room.room_no.startswith(filters.room_no, autoescape=True))
+        return stmt
+
+    def export_select(self, flatten: bool = False):
+        stmt = super().export_select()
+        if flatten:
+            stmt = (
+                stmt.join(Building, Room.building_id == Building.id)
+                .join(Campus, Building.campus_id == Campus.id)
+                .add_columns(
+                    Building.prefix.label("building_prefix"),
+                    Building.building_no.label("building_no"),
+                    Building.campus_id.label("campus_id"),
+                    Campus.code.label("campus_code"),
+                    Campus.name.label("campus_name"),
+                )
+            )
+        return stmt.order_by(Room.created_at, Room.id)
+
+    async def stats(self, group_by: str, campus_id: Optional[UUID] = None, building_id: Optional[UUID] = None):
+        """Room count and seats per (group, status, type) in a single GROUP BY query.
+
+        `group_by` is "campus", "building" or "floor"; floors are grouped within
+        their building.
+        """
+        group_columns = {
+            "campus": [Building.campus_id],
+            "building": [Building.campus_id, Room.building_id],
+            "floor": [Building.campus_id, Room.building_id, Room.floor],
+        }[group_by]
+        stmt = (
+            select(
+                *group_columns,
+                Room.status,
+                Room.type,
+                func.count(Room.id).label("rooms"),
+                func.coalesce(func.sum(Room.capacity), 0).label("capacity"),
+            )
+            .join(Building, Room.building_id == Building.id)
+            .where(Room.deleted_at.is_(None), Building.deleted_at.is_(None))
+            .group_by(*group_columns, Room.status, Room.type)
+        )
+        if campus_id is not None:
+            stmt = stmt.where(Building.campus_id == campus_id)
+        if building_id is not None:
+            stmt = stmt.where(Room.building_id == building_id)
         result = await self.session.execute(stmt)
-        return result.scalars().unique().all()
+        return result.mappings().all()
 
     async def exists_in_building(self, building_id: UUID, room_no: str) -> bool:
         stmt = (
@@ -35,19 +119,41 @@ class RoomRepository(BaseRepository[Room]):
         return result.scalar() is not None
 
     async def create(self, room: Room):
-        self.session.add(room)
-        await self.session.commit()
-        await self.session.refresh(room)
+        room = await super().create(room)
+        added = room_stats_cache.snapshot(room)
+        after_commit(self.session, lambda: room_stats_cache.apply(added, 1))
         return room
 
     async def update(self, room: Room, data: dict):
-        for key, value in data.items():
-            setattr(room, key, value)
-        await self.session.commit()
-        await self.session.refresh(room)
+        before = room_stats_cache.snapshot(room)
+        room = await super().update(room, data)
+        if room.deleted_at is not None:
+            after_commit(self.session, lambda: room_stats_cache.apply(before, -1))
+        else:
+            after = room_stats_cache.snapshot(room)
+            after_commit(self.session, lambda: room_stats_cache.changed(before, after))
         return room
 
-    async def soft_delete(self, room: Room):
-        room.deleted_at = datetime.utcnow()
-        await self.session.commit()
-        return room
+    async def update_where(self, values: dict, *where) -> int:
+        count = await super().update_where(values, *where)
+        if count:
+            after_commit(self.session, room_stats_cache.invalidate)
+        return count
+
+    async def batch_update(self, values: dict, ids=None, building_id: Optional[UUID] = None,
+                           floor: Optional[int] = None) -> int:
+        """Update the live rooms matching every given selector in one statement."""
+        where = [Room.deleted_at.is_(None)]
+        if ids is not None:
+            where.append(Room.id.in_(set(ids)))
+        if building_id is not None:
+            where.append(Room.building_id == building_id)
+        if floor is not None:
+            where.append(Room.floor == floor)
+        return await self.update_where(values, *where)
+
+    async def bulk_insert(self, rows: list[dict]) -> list:
+        inserted = await super().bulk_insert(rows)
+        if inserted:
+            after_commit(self.session, room_stats_cache.invalidate)
+        return inserted
@@ -1,6 +1,8 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
+from app.auth.principal_cache import principal_cache
+from app.core.unit_of_work import after_commit
 from app.repositories.base import BaseRepository
 from uuid import UUID
 
@@ -30,17 +32,15 @@ class UserRepository(BaseRepository[User]):
             hashed_password=hashed_password,
             role=role
         )
-
-        self.session.add(new_user)
-        await self.session.commit()
-        await self.session.refresh(new_user)
-        return new_user
+        return await self.create(new_user)
 
     async def update(self, user: User, data: dict):
-        for key, value in data.items():
-            setattr(user, key, value)
-        await self.session.commit()
-        await self.session.refresh(user)
+        user = await super().update(user, data)
+
+        # Status and role decide what the cached principal may do; drop it on
+        # any update so the next request re-reads the committed row.
+        user_id = user.id
+        after_commit(self.session, lambda: principal_cache.invalidate(user_id))
 
         return user
 
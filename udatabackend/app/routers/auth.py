@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.functions import current_user
-from typing import List
+from typing import List, Optional
 
-from app.auth.security import verify_password, create_access_token
+from app.auth.security import verify_password_async, create_access_token
 from app.core.database import get_session
+from app.core.unit_of_work import UnitOfWork, get_unit_of_work
+from app.core.pagination import PageParams, page_params
+from app.schemas.pagination import Page
 from app.repositories.user_repo import UserRepository
 from app.schemas.auth import LoginRequest, TokenResponse, RegisterRequest, RegisterResponse
 from app.services.user_service import UserService
@@ -18,8 +21,8 @@ from uuid import UUID
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 @router.post("/register", response_model=RegisterResponse)
-async def register_user(payload: RegisterRequest, db: AsyncSession = Depends(get_session)):
-    user_repo = UserRepository(db)
+async def register_user(payload: RegisterRequest, uow: UnitOfWork = Depends(get_unit_of_work, scope="function")):
+    user_repo = UserRepository(uow.session)
     user_service = UserService(user_repo)
 
     return await user_service.register_user(
@@ -37,7 +40,7 @@ async def login(payload: LoginRequest, session: AsyncSession = Depends(get_sessi
     repo = UserRepository(session)
     user = await repo.get_by_username(payload.username)
 
-    if not user or not verify_password(payload.password, user.hashed_password):
+    if not user or not await verify_password_async(payload.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     access_token = create_access_token(subject=str(user.id))
@@ -54,27 +57,28 @@ async def get_my_profile(
     return await service.get_profile(current_user.id)
 
 
-@router.get("/users", response_model=List[UserResponse])
+@router.get("/users", response_model=List[UserResponse] | Page[UserResponse])
 async def get_all_users(
+        page: Optional[PageParams] = Depends(page_params),
         session: AsyncSession = Depends(get_session),
         current_user: User = Depends(get_current_user)):
 
     repo = UserRepository(session)
     service = UserService(repo)
-    return await service.list_users()
+    return await service.list_users(page)
 
 @router.put("/user/{user_id}", response_model=UserResponse)
 async def update_user(
         user_id: UUID,
         payload: UserUpdate,
-        session: AsyncSession = Depends(get_session),
+        uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
         current_user: User = Depends(get_current_user),
     ):
 
     if current_user.role != "ADMIN":
         raise HTTPException(status_code=403, detail="Only Admin can update user")
 
-    repo = UserRepository(session)
+    repo = UserRepository(uow.session)
     service = UserService(repo)
 
     return await service.update_user(user_id, payload)
\ No newline at end of file
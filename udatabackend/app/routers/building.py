@@ -1,7 +1,7 @@
 # routers/building.py
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from app.schemas.building import (
@@ -9,9 +9,15 @@ from app.schemas.building import (
     BuildingUpdate,
     BuildingResponse,
     BuildingDeleteResponse,
+    BuildingFilter,
 )
 from app.services.building_service import BuildingService
+from app.services.audit_service import audit_expand_params
 from app.core.database import get_session
+from app.core.unit_of_work import UnitOfWork, get_unit_of_work
+from app.core.response_cache import CachedRead, cached_read
+from app.core.pagination import PageParams, page_params
+from app.schemas.pagination import Page
 from app.auth.dependencies import get_current_user
 from app.models.user import User
 
@@ -21,50 +27,60 @@ router = APIRouter(prefix="/buildings", tags=["Buildings"])
 @router.post("/", response_model=BuildingResponse)
 async def create_building(
         payload: BuildingCreate,
-        session: AsyncSession = Depends(get_session),
+        uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
         current_user: User = Depends(get_current_user)
     ):
-    service = BuildingService(session, current_user)
+    service = BuildingService(uow.session, current_user)
     return await service.create_building( payload )
 
 
-@router.get("/", response_model=List[BuildingResponse])
+@router.get("/", response_model=List[BuildingResponse] | Page[BuildingResponse])
 async def list_buildings(
+        page: Optional[PageParams] = Depends(page_params),
+        expand: frozenset[str] = Depends(audit_expand_params),
+        filters: BuildingFilter = Depends(),
+        cache: CachedRead = Depends(cached_read("building")),
         session: AsyncSession = Depends(get_session),
         current_user: User = Depends(get_current_user)
     ):
     service = BuildingService(session, current_user)
-    return await service.list_buildings()
+    return await cache.respond(lambda: service.list_buildings(page, expand, filters, fields=cache.fields))
 
 
 @router.get("/{building_id}", response_model=BuildingResponse)
 async def get_building(
         building_id: UUID,
+        expand: frozenset[str] = Depends(audit_expand_params),
+        cache: CachedRead = Depends(cached_read("building")),
         session: AsyncSession = Depends(get_session),
         current_user: User = Depends(get_current_user)
     ):
     service = BuildingService(session, current_user)
-    return await service.get_building(building_id)
+    return await cache.respond(lambda: service.get_building(building_id, expand=expand))
 
 
-@router.get("/campus/{campus_id}", response_model=List[BuildingResponse])
+@router.get("/campus/{campus_id}", response_model=List[BuildingResponse] | Page[BuildingResponse])
 async def list_buildings_by_campus(
         campus_id: UUID,
+        page: Optional[PageParams] = Depends(page_params),
+        expand: frozenset[str] = Depends(audit_expand_params),
+        filters: BuildingFilter = Depends(),
+        cache: CachedRead = Depends(cached_read("building")),
         session: AsyncSession = Depends(get_session),
         current_user: User = Depends(get_current_user)
     ):
     service = BuildingService(session, current_user)
-    return await service.list_buildings_by_campus(campus_id)
+    return await cache.respond(lambda: service.list_buildings_by_campus(campus_id, page, expand, filters, fields=cache.fields))
 
 
 @router.put("/{building_id}", response_model=BuildingResponse)
 async def update_building(
     building_id: UUID,
     payload: BuildingUpdate,
-    session: AsyncSession = Depends(get_session),
+    uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
     current_user: User = Depends(get_current_user)
 ):
-    service = BuildingService(session, current_user)
+    service = BuildingService(uow.session, current_user)
     return await service.update_building(building_id, payload)
 
 
@@ -72,8 +88,20 @@ async def update_building(
 @router.delete("/{building_id}", response_model=BuildingDeleteResponse)
 async def delete_building(
         building_id: UUID,
-        session: AsyncSession = Depends(get_session),
+        cascade: bool = False,
+        uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
         current_user: User = Depends(get_current_user)
     ):
-    service = BuildingService(session, current_user)
-    return await service.delete_building(building_id)
+    service = BuildingService(uow.session, current_user)
+    return await service.delete_building(building_id, cascade)
+
+
+@router.post("/{building_id}/restore", response_model=BuildingResponse)
+async def restore_building(
+        building_id: UUID,
+        cascade: bool = False,
+        uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+        current_user: User = Depends(get_current_user)
+    ):
+    service = BuildingService(uow.session, current_user)
+    return await service.restore_building(building_id, cascade)
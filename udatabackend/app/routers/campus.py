@@ -1,10 +1,17 @@
 # routers/campus.py
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from app.schemas.campus import CampusCreate, CampusResponse, CampusUpdate, CampusDeleteResponse
+from app.schemas.nested import CampusWithBuildings
+from app.models.enums import RoomStatus
 from app.services.campus_service import CampusService
+from app.services.audit_service import audit_expand_params
 from app.core.database import get_session
+from app.core.unit_of_work import UnitOfWork, get_unit_of_work
+from app.core.response_cache import CachedRead, cached_read
+from app.core.pagination import PageParams, page_params
+from app.schemas.pagination import Page
 from app.auth.dependencies import get_current_user
 from app.models.user import User
 from uuid import UUID
@@ -14,50 +21,95 @@ router = APIRouter(prefix="/campuses", tags=["Campuses"])
 @router.post("/", response_model=CampusResponse)
 async def create_campus(
         payload: CampusCreate,
-        session: AsyncSession = Depends(get_session),
+        uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
         current_user: User = Depends(get_current_user)
     ):
-    service = CampusService(session, current_user)
+    service = CampusService(uow.session, current_user)
     return await service.create_campus(payload.code, payload.name, payload.address, payload.status)
 
 
-@router.get("/", response_model=List[CampusResponse])
+@router.get("/", response_model=List[CampusResponse] | Page[CampusResponse])
 async def list_campuses(
+        page: Optional[PageParams] = Depends(page_params),
+        expand: frozenset[str] = Depends(audit_expand_params),
+        cache: CachedRead = Depends(cached_read("campus")),
+        session: AsyncSession = Depends(get_session),
+        current_user: User = Depends(get_current_user)
+    ):
+    service = CampusService(session, current_user)
+    return await cache.respond(lambda: service.list_campuses(page, expand, fields=cache.fields))
+
+
+@router.get("/tree", response_model=List[CampusWithBuildings])
+async def get_campus_trees(
+        room_status: Optional[RoomStatus] = None,
+        cache: CachedRead = Depends(cached_read("campus", "building", "room")),
         session: AsyncSession = Depends(get_session),
         current_user: User = Depends(get_current_user)
     ):
     service = CampusService(session, current_user)
-    return await service.list_campuses()
+    return await cache.respond_plain(lambda: service.get_tree(room_status=room_status))
+
+
+@router.get("/{campus_id}/tree", response_model=CampusWithBuildings)
+async def get_campus_tree(
+        campus_id: UUID,
+        room_status: Optional[RoomStatus] = None,
+        cache: CachedRead = Depends(cached_read("campus", "building", "room")),
+        session: AsyncSession = Depends(get_session),
+        current_user: User = Depends(get_current_user)
+    ):
+    service = CampusService(session, current_user)
+
+    async def tree():
+        return (await service.get_tree(campus_id, room_status))[0]
+
+    return await cache.respond_plain(tree)
 
 
 @router.get("/{campus_id}", response_model=CampusResponse)
 async def get_campus(
         campus_id: UUID,
+        expand: frozenset[str] = Depends(audit_expand_params),
+        cache: CachedRead = Depends(cached_read("campus")),
         session: AsyncSession = Depends(get_session),
         current_user: User = Depends(get_current_user)
     ):
     service = CampusService(session, current_user)
-    return await service.get_campus(campus_id)
+    return await cache.respond(lambda: service.get_campus(campus_id, expand))
 
 
 @router.put("/{campus_id}", response_model=CampusResponse)
 async def update_campus(
         campus_id: UUID,
         payload: CampusUpdate,
-        session: AsyncSession = Depends(get_session),
+        uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
         current_user: User = Depends(get_current_user)
     ):
-    service = CampusService(session, current_user)
+    service = CampusService(uow.session, current_user)
     return await service.update_campus(campus_id, payload)
 
 
 @router.delete("/{campus_id}", response_model=CampusDeleteResponse)
 async def delete_campus(
         campus_id: UUID,
-        session: AsyncSession = Depends(get_session),
+        cascade: bool = False,
+        uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
         current_user: User = Depends(get_current_user)
     ):
-    service = CampusService(session, current_user)
-    return await service.delete_campus(campus_id)
+    service = CampusService(uow.session, current_user)
+    return await service.delete_campus(campus_id, cascade)
+
 
     #CampusDeleteResponse(id=str(campus.id), deleted_at=campus.deleted_at.isoformat()))
+
+
+@router.post("/{campus_id}/restore", response_model=CampusResponse)
+async def restore_campus(
+        campus_id: UUID,
+        cascade: bool = False,
+        uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+        current_user: User = Depends(get_current_user)
+    ):
+    service = CampusService(uow.session, current_user)
+    return await service.restore_campus(campus_id, cascade)
@@ -0,0 +1,30 @@
+# routers/export.py
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.dependencies import get_current_user
+from app.core.database import get_session
+from app.models.user import User
+from app.services.export_service import EXPORT_MEDIA_TYPES, ExportService
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+
+@router.get("/{kind}")
+async def export_inventory(
+        kind: Literal["campuses", "buildings", "rooms"],
+        format: Literal["ndjson", "csv"] = Query("ndjson"),
+        flatten: bool = Query(False, description="Add parent building/campus columns; not for campuses"),
+        session: AsyncSession = Depends(get_session),
+        current_user: User = Depends(get_current_user)
+    ):
+    # get_session is request scoped, so the session stays open while streaming
+    service = ExportService(session)
+    return StreamingResponse(
+        await service.export(kind, format, flatten),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{kind}.{format}"'},
+    )
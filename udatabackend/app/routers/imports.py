@@ -0,0 +1,40 @@
+# routers/imports.py
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.dependencies import get_current_user
+from app.core.database import get_session
+from app.models.user import User
+from app.schemas.imports import ImportReport
+from app.services.import_service import ImportService, read_rows
+
+router = APIRouter(prefix="/import", tags=["Import"])
+
+
+def detect_format(filename: str | None, fmt: str | None) -> str:
+    if fmt:
+        return fmt
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Cannot tell the file format; pass ?format=csv or ?format=ndjson"
+    )
+
+
+@router.post("/{kind}", response_model=ImportReport)
+async def import_inventory(
+        kind: Literal["campuses", "buildings", "rooms"],
+        file: UploadFile = File(...),
+        format: Optional[Literal["csv", "ndjson"]] = Query(None),
+        session: AsyncSession = Depends(get_session),
+        current_user: User = Depends(get_current_user)
+    ):
+    fmt = detect_format(file.filename, format)
+    service = ImportService(session, current_user)
+    return await service.import_rows(kind, read_rows(file.file, fmt))
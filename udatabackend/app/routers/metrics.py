@@ -0,0 +1,120 @@
+# routers/metrics.py
+import os
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+
+from app.auth.dependencies import get_current_user
+from app.auth.principal_cache import principal_cache
+from app.auth.security import hashing_pool
+from app.auth.token_cache import token_cache
+from app.core.metrics import Exposition
+from app.core.pool_metrics import pool_metrics
+from app.core.query_stats import query_metrics
+from app.core.request_metrics import request_metrics
+from app.core.response_cache import response_cache
+from app.core.startup import startup_report
+from app.models.user import User
+
+# Bearer token scrapers must send to GET /metrics. Without one the endpoint is
+# refused unless METRICS_PUBLIC opens it, for deployments where the port is
+# only reachable from the monitoring network.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+METRICS_PUBLIC = os.getenv("METRICS_PUBLIC", "false").lower() in ("1", "true")
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+def _check_scrape_token(authorization: str | None = Header(None)):
+    if not METRICS_TOKEN:
+        if METRICS_PUBLIC:
+            return
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN,
+                            detail="Metrics are disabled: set METRICS_TOKEN, or METRICS_PUBLIC=true")
+    if not secrets.compare_digest(authorization or "", f"Bearer {METRICS_TOKEN}"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+
+
+def _scrape() -> str:
+    out = Exposition()
+    routes = list(request_metrics)
+
+    def labels(route):
+        return {"method": route.method, "route": route.path}
+
+    out.metric("http_requests_total", "counter", "HTTP requests by route and status class.", [
+        ({**labels(route), "status": f"{status_class}xx"}, count)
+        for route in routes
+        for status_class, count in enumerate(route.responses)
+        if count
+    ])
+    out.histogram("http_request_duration_seconds", "HTTP request latency, until the last body chunk.",
+                  [(labels(route), route.latency) for route in routes])
+    out.histogram("http_response_size_bytes", "HTTP response body sizes.",
+                  [(labels(route), route.response_size) for route in routes])
+    out.metric("http_requests_in_flight", "gauge", "HTTP requests being served.", request_metrics.in_flight)
+
+    queries = [(dict(zip(("method", "route"), key.split(" ", 1))), totals)
+               for key, totals in query_metrics.routes.items()]
+    out.metric("db_queries_total", "counter", "SQL statements run by requests, by route.",
+               [(route, totals.queries) for route, totals in queries])
+    out.metric("db_query_seconds_total", "counter", "Database time of requests, by route.",
+               [(route, totals.seconds) for route, totals in queries])
+    out.metric("db_repeated_statement_requests_total", "counter",
+               "Requests that repeated one statement past the N+1 threshold.",
+               [(route, totals.repeated) for route, totals in queries])
+
+    pool = pool_metrics.stats()
+    for key, kind, help in (
+        ("size", "gauge", "Configured pool size."),
+        ("checked_out", "gauge", "Connections in use."),
+        ("checked_in", "gauge", "Idle connections in the pool."),
+        ("overflow", "gauge", "Connections opened beyond the pool size."),
+    ):
+        if key in pool:
+            out.metric(f"db_pool_{key}", kind, help, pool[key])
+    out.metric("db_pool_checkouts_total", "counter", "Connection checkouts.", pool_metrics.checkouts)
+    out.metric("db_pool_timeouts_total", "counter", "Checkouts that timed out.", pool_metrics.timeouts)
+    out.metric("db_pool_connects_total", "counter", "Connections opened.", pool_metrics.connects)
+    out.histogram("db_pool_checkout_wait_seconds", "Time to obtain a connection.",
+                  [({}, pool_metrics.checkout_wait)])
+    out.histogram("db_pool_connection_lifetime_seconds", "Lifetime of closed connections.",
+                  [({}, pool_metrics.connection_lifetime)])
+
+    for name, cache in (("response", response_cache), ("principal", principal_cache), ("token", token_cache)):
+        out.metric(f"{name}_cache_hits_total", "counter", f"{name.capitalize()} cache hits.", cache.hits)
+        out.metric(f"{name}_cache_misses_total", "counter", f"{name.capitalize()} cache misses.", cache.misses)
+
+    hashing = hashing_pool.stats()
+    out.metric("password_hash_in_flight", "gauge", "Password hashes running.", hashing["in_flight"])
+    out.metric("password_hash_queued", "gauge", "Password hashes waiting for a worker.", hashing["queued"])
+    out.metric("password_hash_completed_total", "counter", "Password hashes completed.", hashing["completed"])
+    out.metric("password_hash_rejected_total", "counter", "Password hashes turned away.", hashing["rejected"])
+
+    for key, help in (
+        ("import_seconds", "Time to import the application."),
+        ("startup_seconds", "Time spent in the startup hook."),
+        ("first_request_seconds", "Latency of the first request served."),
+    ):
+        value = getattr(startup_report, key)
+        if value is not None:
+            out.metric(f"startup_{key}", "gauge", help, value)
+    return out.render()
+
+
+@router.get("", dependencies=[Depends(_check_scrape_token)], include_in_schema=False)
+async def scrape():
+    """Request, database, pool and cache metrics in the Prometheus text format."""
+    return Response(content=_scrape(), media_type=Exposition.CONTENT_TYPE)
+
+
+@router.get("/pool")
+async def pool_stats(current_user: User = Depends(get_current_user)):
+    """Connection pool occupancy, checkout waits and connection lifetimes."""
+    return pool_metrics.stats()
+
+
+@router.get("/queries")
+async def query_stats(current_user: User = Depends(get_current_user)):
+    """Statements per route: count, database time, rows returned and written, and likely N+1 requests."""
+    return query_metrics.stats()
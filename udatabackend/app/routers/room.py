@@ -1,16 +1,24 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from app.schemas.room import (
     RoomCreate,
     RoomUpdate,
     RoomResponse,
-    RoomDeleteResponse
+    RoomDeleteResponse,
+    RoomFilter,
+    RoomBatchUpdate,
+    RoomBatchUpdateResponse,
 )
 from app.services.room_service import RoomService
+from app.services.audit_service import audit_expand_params
 from app.core.database import get_session
+from app.core.unit_of_work import UnitOfWork, get_unit_of_work
+from app.core.response_cache import CachedRead, cached_read
+from app.core.pagination import PageParams, page_params
+from app.schemas.pagination import Page
 from app.auth.dependencies import get_current_user
 from app.models.user import User
 
@@ -20,58 +28,79 @@ router = APIRouter(prefix="/rooms", tags=["Rooms"])
 @router.post("/", response_model=RoomResponse)
 async def create_room(
     payload: RoomCreate,
-    session: AsyncSession = Depends(get_session),
+    uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
     current_user: User = Depends(get_current_user)
 ):
-    service = RoomService(session, current_user)
+    service = RoomService(uow.session, current_user)
     return await service.create_room(payload)
 
 
-@router.get("/", response_model=List[RoomResponse])
+@router.get("/", response_model=List[RoomResponse] | Page[RoomResponse])
 async def list_rooms(
+    page: Optional[PageParams] = Depends(page_params),
+    expand: frozenset[str] = Depends(audit_expand_params),
+    filters: RoomFilter = Depends(),
+    cache: CachedRead = Depends(cached_read("room")),
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     service = RoomService(session, current_user)
-    return await service.list_rooms()
+    return await cache.respond(lambda: service.list_rooms(page, expand, filters, fields=cache.fields))
 
 
 @router.get("/{room_id}", response_model=RoomResponse)
 async def get_room(
     room_id: UUID,
+    expand: frozenset[str] = Depends(audit_expand_params),
+    cache: CachedRead = Depends(cached_read("room")),
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     service = RoomService(session, current_user)
-    return await service.get_room(room_id)
+    return await cache.respond(lambda: service.get_room(room_id, expand))
 
 
-@router.get("/building/{building_id}", response_model=List[RoomResponse])
+@router.get("/building/{building_id}", response_model=List[RoomResponse] | Page[RoomResponse])
 async def list_rooms_by_building(
     building_id: UUID,
+    page: Optional[PageParams] = Depends(page_params),
+    expand: frozenset[str] = Depends(audit_expand_params),
+    filters: RoomFilter = Depends(),
+    cache: CachedRead = Depends(cached_read("room")),
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     service = RoomService(session, current_user)
-    return await service.list_rooms_by_building(building_id)
+    return await cache.respond(lambda: service.list_rooms_by_building(building_id, page, expand, filters, fields=cache.fields))
 
 
 @router.put("/{room_id}", response_model=RoomResponse)
 async def update_room(
     room_id: UUID,
     payload: RoomUpdate,
-    session: AsyncSession = Depends(get_session),
+    uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
     current_user: User = Depends(get_current_user)
 ):
-    service = RoomService(session, current_user)
+    service = RoomService(uow.session, current_user)
     return await service.update_room(room_id, payload)
 
 
 @router.delete("/{room_id}", response_model=RoomDeleteResponse)
 async def delete_room(
     room_id: UUID,
-    session: AsyncSession = Depends(get_session),
+    uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
     current_user: User = Depends(get_current_user)
 ):
-    service = RoomService(session, current_user)
+    service = RoomService(uow.session, current_user)
     return await service.delete_room(room_id)
+
+
+@router.patch("/batch", response_model=RoomBatchUpdateResponse)
+async def batch_update_rooms(
+    payload: RoomBatchUpdate,
+    uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+    current_user: User = Depends(get_current_user)
+):
+    service = RoomService(uow.session, current_user)
+    updated = await service.batch_update_rooms(payload)
+    return RoomBatchUpdateResponse(updated=updated)
@@ -0,0 +1,26 @@
+# routers/stats.py
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.dependencies import get_current_user
+from app.core.database import get_session
+from app.models.user import User
+from app.schemas.stats import RoomStats, StatsGrouping
+from app.services.stats_service import StatsService
+
+router = APIRouter(prefix="/stats", tags=["Stats"])
+
+
+@router.get("/rooms", response_model=RoomStats)
+async def room_stats(
+        group_by: StatsGrouping = Query("building"),
+        campus_id: Optional[UUID] = Query(None),
+        building_id: Optional[UUID] = Query(None),
+        session: AsyncSession = Depends(get_session),
+        current_user: User = Depends(get_current_user)
+    ):
+    service = StatsService(session)
+    return await service.room_stats(group_by, campus_id, building_id)
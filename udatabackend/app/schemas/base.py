@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_serializer
 
 class BaseSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -12,4 +12,20 @@ class AuditResponse(BaseSchema):
     created_by_id: UUID | None
     updated_by_id: UUID | None
 
+class AuditUser(BaseSchema):
+    id: UUID
+    username: str
+    full_name: str | None = None
 
+class AuditExpansion(BaseModel):
+    """Audit users attached by ?expand=; left out of the payload unless expanded."""
+    created_by: AuditUser | None = None
+    updated_by: AuditUser | None = None
+
+    @model_serializer(mode="wrap")
+    def _omit_unexpanded(self, handler):
+        data = handler(self)
+        for field in ("created_by", "updated_by"):
+            if data.get(field) is None:
+                data.pop(field, None)
+        return data
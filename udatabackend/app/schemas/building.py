@@ -1,10 +1,11 @@
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Literal
 
 from pydantic import BaseModel
 
 from app.models.enums import BuildingStatus, BuildingType
+from app.schemas.base import AuditExpansion
 
 
 class BuildingBase(BaseModel):
@@ -27,7 +28,7 @@ class BuildingUpdate(BaseModel):
     status: Optional[BuildingStatus] = None
 
 
-class BuildingResponse(BuildingBase):
+class BuildingResponse(BuildingBase, AuditExpansion):
     id: UUID
     campus_id: UUID
     created_at: datetime
@@ -42,4 +43,15 @@ class BuildingDeleteResponse(BuildingResponse):
     deleted_at: datetime
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+
+
+class BuildingFilter(BaseModel):
+    campus_id: Optional[UUID] = None
+    status: Optional[BuildingStatus] = None
+    type: Optional[BuildingType] = None
+    prefix: Optional[str] = None
+    building_no: Optional[str] = None  # matches building numbers starting with this
+    sort: Literal[
+        "created_at", "-created_at", "building_no", "-building_no", "floors", "-floors"
+    ] = "created_at"
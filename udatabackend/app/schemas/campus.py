@@ -4,6 +4,7 @@ from typing import Optional
 from app.models.enums import CampusStatus
 from datetime import datetime
 from uuid import UUID
+from app.schemas.base import AuditExpansion
 
 
 class CampusBase(BaseModel):
@@ -24,7 +25,7 @@ class CampusUpdate(CampusBase):
     pass
 
 
-class CampusResponse(BaseModel):
+class CampusResponse(AuditExpansion):
     id: UUID
     code: str
     name: str
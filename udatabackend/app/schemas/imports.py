@@ -0,0 +1,56 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, model_validator
+
+from app.schemas.building import BuildingBase
+from app.schemas.campus import CampusCreate
+from app.schemas.room import RoomBase
+
+
+class CampusImportRow(CampusCreate):
+    address: Optional[str] = None
+
+
+class BuildingImportRow(BuildingBase):
+    # either the campus id or its code
+    campus_id: Optional[UUID] = None
+    campus_code: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_campus_reference(self):
+        if self.campus_id is None and not self.campus_code:
+            raise ValueError("campus_id or campus_code is required")
+        if self.floors is not None and self.floors < 0:
+            raise ValueError("Floors cannot be negative")
+        return self
+
+
+class RoomImportRow(RoomBase):
+    # either the building id or the (campus_code, building_no) natural key
+    building_id: Optional[UUID] = None
+    campus_code: Optional[str] = None
+    building_no: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_building_reference(self):
+        if self.building_id is None and not (self.campus_code and self.building_no):
+            raise ValueError("building_id or campus_code and building_no are required")
+        if self.capacity is not None and self.capacity < 0:
+            raise ValueError("Capacity cannot be negative")
+        return self
+
+
+class ImportRowError(BaseModel):
+    row: int
+    error: str
+
+
+class ImportReport(BaseModel):
+    kind: str
+    total: int = 0
+    created: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: list[ImportRowError] = []
+    errors_truncated: bool = False
@@ -0,0 +1,10 @@
+from typing import Generic, TypeVar
+
+from app.schemas.base import BaseSchema
+
+T = TypeVar("T")
+
+
+class Page(BaseSchema, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
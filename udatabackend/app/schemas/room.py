@@ -1,9 +1,10 @@
 from uuid import UUID
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 from app.models.enums import RoomStatus, RoomType
+from app.schemas.base import AuditExpansion
 
 
 class RoomBase(BaseModel):
@@ -28,7 +29,23 @@ class RoomUpdate(BaseModel):
     status: Optional[RoomStatus] = None
     meta_info: Optional[Dict] = None
 
-class RoomResponse(RoomBase):
+class RoomBatchUpdate(BaseModel):
+    # rooms matching every given selector are updated
+    ids: Optional[List[UUID]] = None
+    building_id: Optional[UUID] = None
+    floor: Optional[int] = None
+    changes: RoomUpdate
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if self.ids is None and self.building_id is None:
+            raise ValueError("ids or building_id is required")
+        return self
+
+class RoomBatchUpdateResponse(BaseModel):
+    updated: int
+
+class RoomResponse(RoomBase, AuditExpansion):
     id: UUID
     building_id: UUID
     created_at: datetime
@@ -43,3 +60,19 @@ class RoomDeleteResponse(RoomResponse):
 
     class Config:
         orm_mode = True
+
+
+class RoomFilter(BaseModel):
+    building_id: Optional[UUID] = None
+    campus_id: Optional[UUID] = None
+    status: Optional[RoomStatus] = None
+    type: Optional[RoomType] = None
+    floor_min: Optional[int] = None
+    floor_max: Optional[int] = None
+    min_capacity: Optional[int] = None
+    prefix: Optional[str] = None
+    room_no: Optional[str] = None  # matches room numbers starting with this
+    sort: Literal[
+        "created_at", "-created_at", "room_no", "-room_no",
+        "floor", "-floor", "capacity", "-capacity"
+    ] = "created_at"
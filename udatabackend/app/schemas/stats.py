@@ -0,0 +1,25 @@
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.models.enums import RoomStatus, RoomType
+
+StatsGrouping = Literal["campus", "building", "floor"]
+
+
+class RoomStatsGroup(BaseModel):
+    campus_id: Optional[UUID] = None
+    building_id: Optional[UUID] = None
+    floor: Optional[int] = None
+    status: RoomStatus
+    type: RoomType
+    rooms: int
+    capacity: int
+
+
+class RoomStats(BaseModel):
+    group_by: StatsGrouping
+    total_rooms: int
+    total_capacity: int
+    groups: list[RoomStatsGroup]
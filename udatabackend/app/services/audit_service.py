@@ -0,0 +1,55 @@
+# services/audit_service.py
+from typing import Iterable, Optional
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.repositories.user_repo import UserRepository
+
+AUDIT_FIELDS = ("created_by", "updated_by")
+
+
+def audit_expand_params(
+        expand: Optional[str] = Query(None, description="Comma separated: created_by, updated_by")
+) -> frozenset[str]:
+    if not expand:
+        return frozenset()
+    fields = frozenset(f.strip() for f in expand.split(",") if f.strip())
+    unknown = fields - set(AUDIT_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot expand: {', '.join(sorted(unknown))}"
+        )
+    return fields
+
+
+async def expand_audit_users(session: AsyncSession, result, fields: Iterable[str]):
+    """Attach the requested audit users to every row of `result` with one `IN` query.
+
+    `result` is a single entity, a list of entities or a pagination page.
+    """
+    fields = [f for f in AUDIT_FIELDS if f in fields]
+    if not fields or result is None:
+        return result
+
+    if isinstance(result, dict):
+        items = result["items"]
+    elif isinstance(result, (list, tuple)):
+        items = result
+    else:
+        items = [result]
+
+    user_ids = {
+        getattr(item, f"{field}_id")
+        for item in items
+        for field in fields
+    }
+    user_ids.discard(None)
+    users = await UserRepository(session).get_many(user_ids)
+
+    for item in items:
+        for field in fields:
+            set_committed_value(item, field, users.get(getattr(item, f"{field}_id")))
+    return result
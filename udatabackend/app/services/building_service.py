@@ -1,12 +1,16 @@
 # services/building_service.py
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from uuid import UUID
 
+from app.core.pagination import PageParams
 from app.models.building import Building
 from app.models.user import User
 from app.repositories.building_repo import BuildingRepository
-from app.schemas.building import BuildingCreate, BuildingUpdate
+from app.repositories.campus_repo import CampusRepository
+from app.services.audit_service import expand_audit_users
+from app.schemas.building import BuildingCreate, BuildingUpdate, BuildingFilter
 
 
 class BuildingService:
@@ -14,21 +18,26 @@ class BuildingService:
         self.session = session
         self.current_user = current_user
         self.repo = BuildingRepository(session)
+        self.campus_repo = CampusRepository(session)
 
-    async def get_building(self, building_id: UUID) -> Building:
-        building = await self.repo.get_by_id(building_id)
+    async def get_building(self, building_id: UUID, load=(), expand=()) -> Building:
+        building = await self.repo.get_by_id(building_id, load)
         if not building:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Building not found"
             )
-        return building
+        return await expand_audit_users(self.session, building, expand)
 
-    async def list_buildings(self):
-        return await self.repo.list_all()
+    async def list_buildings(self, page: Optional[PageParams] = None, expand=(),
+                             filters: Optional[BuildingFilter] = None, fields=None):
+        buildings = await self.repo.list_all(page, filters=filters, fields=fields)
+        return await expand_audit_users(self.session, buildings, expand)
 
-    async def list_buildings_by_campus(self, campus_id: UUID):
-        return await self.repo.list_buildings_by_campus(campus_id)
+    async def list_buildings_by_campus(self, campus_id: UUID, page: Optional[PageParams] = None, expand=(),
+                                       filters: Optional[BuildingFilter] = None, fields=None):
+        buildings = await self.repo.list_buildings_by_campus(campus_id, page, filters=filters, fields=fields)
+        return await expand_audit_users(self.session, buildings, expand)
     async def create_building(self, payload: BuildingCreate) -> Building:
         # uniqueness check: (campus_id, code)
         if await self.repo.exists_in_campus(payload.campus_id, payload.building_no):
@@ -74,13 +83,34 @@ class BuildingService:
 
         return await self.repo.update(building, update_data)
 
-    async def delete_building(self, building_id: UUID):
+    async def delete_building(self, building_id: UUID, cascade: bool = False):
         building = await self.get_building(building_id)
 
-        if building.rooms:
+        if cascade:
+            return await self.repo.soft_delete_cascade(building, updated_by_id=self.current_user.id)
+
+        if await self.repo.has_rooms(building.id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete building with rooms"
             )
 
         return await self.repo.soft_delete(building)
+
+    async def restore_building(self, building_id: UUID, cascade: bool = False):
+        building = await self.repo.get_deleted(building_id)
+        if not building:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Building not found"
+            )
+
+        if not await self.campus_repo.get_by_id(building.campus_id):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Campus is deleted; restore the campus first"
+            )
+
+        if cascade:
+            return await self.repo.restore_cascade(building, updated_by_id=self.current_user.id)
+        return await self.repo.restore(building, updated_by_id=self.current_user.id)
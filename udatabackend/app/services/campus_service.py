@@ -4,11 +4,21 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
 from app.models.campus import Campus
 from app.repositories.campus_repo import CampusRepository
-from typing import List
+from app.services.audit_service import expand_audit_users
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 
+from app.core.encoding import fill, row_template
+from app.core.pagination import PageParams
+from app.models.enums import RoomStatus
 from app.schemas.campus import CampusUpdate
+from app.schemas.nested import BuildingWithRooms, CampusWithBuildings
+from app.schemas.room import RoomResponse
+
+_CAMPUS_NODE = row_template(CampusWithBuildings)
+_BUILDING_NODE = row_template(BuildingWithRooms)
+_ROOM_NODE = row_template(RoomResponse)
 
 class CampusService:
     def __init__(self, session: AsyncSession, current_user: User):
@@ -29,14 +39,44 @@ class CampusService:
         )
         return await self.repo.create(campus)
 
-    async def list_campuses(self) -> List[Campus]:
-        return await self.repo.list_all()
+    async def list_campuses(self, page: Optional[PageParams] = None, expand=(), fields=None):
+        campuses = await self.repo.list_all(page, fields=fields)
+        return await expand_audit_users(self.session, campuses, expand)
 
-    async def get_campus(self, campus_id: UUID) -> Campus:
+    async def get_campus(self, campus_id: UUID, expand=()) -> Campus:
         campus = await self.repo.get_by_id(campus_id)
         if not campus or campus.deleted_at is not None:
             raise HTTPException(status_code=404, detail="Campus not found")
-        return campus
+        return await expand_audit_users(self.session, campus, expand)
+
+    async def get_tree(self, campus_id: Optional[UUID] = None,
+                       room_status: Optional[RoomStatus] = None) -> List[dict]:
+        """Live campuses with their buildings and rooms, as CampusWithBuildings dicts.
+
+        Each level is fetched with one flat query and attached to its parent
+        through a dict keyed by id. With `room_status`, only rooms in that
+        status are included; buildings and campuses are kept either way.
+        """
+        campus_rows, building_rows, room_rows = await self.repo.tree_rows(
+            list(_CAMPUS_NODE), list(_BUILDING_NODE), list(_ROOM_NODE), campus_id, room_status
+        )
+        if campus_id is not None and not campus_rows:
+            raise HTTPException(status_code=404, detail="Campus not found")
+
+        buildings = {}
+        for row in building_rows:
+            buildings[row["id"]] = fill(_BUILDING_NODE, row)
+            buildings[row["id"]]["rooms"] = []
+        for row in room_rows:
+            buildings[row["building_id"]]["rooms"].append(fill(_ROOM_NODE, row))
+
+        campuses = {}
+        for row in campus_rows:
+            campuses[row["id"]] = fill(_CAMPUS_NODE, row)
+            campuses[row["id"]]["buildings"] = []
+        for building in buildings.values():
+            campuses[building["campus_id"]]["buildings"].append(building)
+        return list(campuses.values())
 
     async def update_campus(self, campus_id: UUID, payload: CampusUpdate) -> Campus:
         campus = await self.get_campus(campus_id)
@@ -47,7 +87,16 @@ class CampusService:
         return await self.repo.update(campus, update_data)
 
 
-    async def delete_campus(self, campus_id: UUID) -> Campus:
+    async def delete_campus(self, campus_id: UUID, cascade: bool = False) -> Campus:
         campus = await self.get_campus(campus_id)
-        campus.updated_by_id = self.current_user.id
-        return await self.repo.soft_delete(campus)
+        if cascade:
+            return await self.repo.soft_delete_cascade(campus, updated_by_id=self.current_user.id)
+        return await self.repo.soft_delete(campus, updated_by_id=self.current_user.id)
+
+    async def restore_campus(self, campus_id: UUID, cascade: bool = False) -> Campus:
+        campus = await self.repo.get_deleted(campus_id)
+        if not campus:
+            raise HTTPException(status_code=404, detail="Campus not found")
+        if cascade:
+            return await self.repo.restore_cascade(campus, updated_by_id=self.current_user.id)
+        return await self.repo.restore(campus, updated_by_id=self.current_user.id)
@@ -0,0 +1,261 @@
+# services/import_service.py
+import codecs
+import csv
+import json
+import os
+import uuid
+from datetime import datetime
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.unit_of_work import UnitOfWork
+from app.models.user import User
+from app.repositories.building_repo import BuildingRepository
+from app.repositories.campus_repo import CampusRepository
+from app.repositories.room_repo import RoomRepository
+from app.schemas.imports import (
+    BuildingImportRow,
+    CampusImportRow,
+    ImportReport,
+    ImportRowError,
+    RoomImportRow,
+)
+
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "1000"))
+IMPORT_MAX_ERRORS = 1000
+
+IMPORT_KINDS = ("campuses", "buildings", "rooms")
+IMPORT_FORMATS = ("csv", "ndjson")
+
+
+def _decoded_lines(stream: BinaryIO, errors: list) -> Iterator[str]:
+    """UTF-8 lines of a binary stream, line endings kept, leading BOM dropped.
+
+    A line that is not valid UTF-8 is yielded with replacement characters and
+    its error is appended to `errors`, so the caller can fail just that row.
+    """
+    for index, raw in enumerate(stream):
+        if index == 0:
+            raw = raw.removeprefix(codecs.BOM_UTF8)
+        try:
+            yield raw.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            errors.append(exc)
+            yield raw.decode("utf-8", errors="replace")
+
+
+def read_rows(stream: BinaryIO, fmt: str) -> Iterator[tuple[int, dict | Exception]]:
+    """Yield `(row_number, row)` from a binary CSV or NDJSON stream, one line at a time.
+
+    Lines that cannot be decoded or parsed are yielded as the exception
+    instead of a row so they can be reported without stopping the import.
+    """
+    errors: list = []
+    lines = _decoded_lines(stream, errors)
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        number = 0
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as exc:
+                row = exc
+            number += 1
+            if errors:
+                row = errors[0]
+                errors.clear()
+            if isinstance(row, Exception):
+                yield number, row
+            else:
+                # empty CSV cells mean "not given"
+                yield number, {k: v for k, v in row.items() if k and v not in ("", None)}
+
+    number = 0
+    for line in lines:
+        if not line.strip():
+            errors.clear()
+            continue
+        number += 1
+        try:
+            if errors:
+                raise errors.pop()
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError("Expected a JSON object")
+            yield number, row
+        except ValueError as exc:
+            yield number, exc
+
+
+def _next_chunk(rows: Iterator, size: int) -> list:
+    return list(islice(rows, size))
+
+
+class ImportService:
+    """Set-based import of campuses, buildings and rooms.
+
+    Rows are processed in chunks: each chunk is read and parsed in a worker
+    thread (the source is a blocking file), validated, its references are
+    resolved with one query, and it is written with a single multi-row
+    `INSERT ... ON CONFLICT DO NOTHING` and committed as its own unit of work.
+    A chunk the database rejects is reported as failed rows; earlier chunks
+    stay committed and the import goes on with the next one.
+    """
+
+    def __init__(self, session: AsyncSession, current_user: Optional[User], chunk_size: int = IMPORT_CHUNK_SIZE):
+        self.session = session
+        self.current_user = current_user
+        self.chunk_size = chunk_size
+        self.campus_repo = CampusRepository(session)
+        self.building_repo = BuildingRepository(session)
+        self.room_repo = RoomRepository(session)
+
+    async def import_rows(self, kind: str, rows: Iterable[tuple[int, dict | Exception]]) -> ImportReport:
+        handler = {
+            "campuses": self._import_campuses,
+            "buildings": self._import_buildings,
+            "rooms": self._import_rooms,
+        }[kind]
+        schema = {
+            "campuses": CampusImportRow,
+            "buildings": BuildingImportRow,
+            "rooms": RoomImportRow,
+        }[kind]
+
+        report = ImportReport(kind=kind)
+        rows = iter(rows)
+        while chunk := await run_in_threadpool(_next_chunk, rows, self.chunk_size):
+            valid = []
+            for number, row in chunk:
+                report.total += 1
+                if isinstance(row, Exception):
+                    self._fail(report, number, f"Unreadable row: {row}")
+                    continue
+                try:
+                    valid.append((number, schema.model_validate(row)))
+                except ValidationError as exc:
+                    self._fail(report, number, "; ".join(
+                        f"{'.'.join(map(str, e['loc'])) or 'row'}: {e['msg']}" for e in exc.errors()
+                    ))
+            if valid:
+                await self._write_chunk(handler, valid, report)
+        return report
+
+    async def _write_chunk(self, handler, valid: list, report: ImportReport):
+        before = (report.created, report.skipped, report.failed, len(report.errors), report.errors_truncated)
+        try:
+            async with UnitOfWork(self.session):
+                await handler(valid, report)
+        except SQLAlchemyError as exc:
+            # the counts and errors recorded for the chunk are void; it was rolled back
+            report.created, report.skipped, report.failed, errors, report.errors_truncated = before
+            del report.errors[errors:]
+            reason = str(getattr(exc, "orig", None) or exc).splitlines()[0]
+            for number, _ in valid:
+                self._fail(report, number, f"Not saved, the database rejected its chunk: {reason}")
+
+    def _fail(self, report: ImportReport, row: int, error: str):
+        report.failed += 1
+        self._error(report, row, error)
+
+    def _skip(self, report: ImportReport, row: int, error: str):
+        report.skipped += 1
+        self._error(report, row, error)
+
+    def _error(self, report: ImportReport, row: int, error: str):
+        if len(report.errors) < IMPORT_MAX_ERRORS:
+            report.errors.append(ImportRowError(row=row, error=error))
+        else:
+            report.errors_truncated = True
+
+    def _audit_columns(self) -> dict:
+        return {
+            "id": uuid.uuid4(),
+            "created_at": datetime.utcnow(),
+            "created_by_id": self.current_user.id if self.current_user else None,
+        }
+
+    async def _insert_unique(self, repo, rows: list[tuple[int, tuple, dict]], report: ImportReport):
+        """Insert rows, reporting duplicates within the chunk and rows already stored.
+
+        Rows with a NULL in their natural key never conflict, so they are always
+        inserted.
+        """
+        keyed, numbers, unkeyed = {}, {}, []
+        for number, key, values in rows:
+            if None in key:
+                unkeyed.append(values)
+                continue
+            if key in keyed:
+                self._skip(report, number, f"Duplicate of row {numbers[key]}")
+                continue
+            keyed[key] = values
+            numbers[key] = number
+
+        inserted = set(await repo.bulk_insert([*keyed.values(), *unkeyed]))
+        report.created += len(unkeyed)
+        for key, number in numbers.items():
+            if key in inserted:
+                report.created += 1
+            else:
+                self._skip(report, number, "Already exists")
+
+    async def _import_campuses(self, valid: list[tuple[int, CampusImportRow]], report: ImportReport):
+        rows = [
+            (number, (row.code,), {**row.model_dump(), **self._audit_columns()})
+            for number, row in valid
+        ]
+        await self._insert_unique(self.campus_repo, rows, report)
+
+    async def _import_buildings(self, valid: list[tuple[int, BuildingImportRow]], report: ImportReport):
+        known_ids = await self.campus_repo.existing_ids(
+            row.campus_id for _, row in valid if row.campus_id is not None
+        )
+        by_code = await self.campus_repo.ids_by_code(
+            row.campus_code for _, row in valid if row.campus_id is None
+        )
+
+        rows = []
+        for number, row in valid:
+            if row.campus_id is not None:
+                campus_id = row.campus_id if row.campus_id in known_ids else None
+            else:
+                campus_id = by_code.get(row.campus_code)
+            if campus_id is None:
+                self._fail(report, number, "Campus not found")
+                continue
+            values = row.model_dump(exclude={"campus_id", "campus_code"})
+            rows.append((number, (campus_id, row.building_no), {
+                **values, "campus_id": campus_id, **self._audit_columns()
+            }))
+        await self._insert_unique(self.building_repo, rows, report)
+
+    async def _import_rooms(self, valid: list[tuple[int, RoomImportRow]], report: ImportReport):
+        known_ids = await self.building_repo.existing_ids(
+            row.building_id for _, row in valid if row.building_id is not None
+        )
+        by_key = await self.building_repo.ids_by_campus_code(
+            (row.campus_code, row.building_no) for _, row in valid if row.building_id is None
+        )
+
+        rows = []
+        for number, row in valid:
+            if row.building_id is not None:
+                building_id = row.building_id if row.building_id in known_ids else None
+            else:
+                building_id = by_key.get((row.campus_code, row.building_no))
+            if building_id is None:
+                self._fail(report, number, "Building not found")
+                continue
+            values = row.model_dump(exclude={"building_id", "campus_code", "building_no", "meta_info"})
+            rows.append((number, (building_id, row.room_no), {
+                **values, "building_id": building_id, **self._audit_columns()
+            }))
+        await self._insert_unique(self.room_repo, rows, report)
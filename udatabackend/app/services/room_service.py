@@ -1,12 +1,15 @@
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from uuid import UUID
 
+from app.core.pagination import PageParams
 from app.models.room import Room
 from app.models.user import User
 from app.repositories.room_repo import RoomRepository
 from app.repositories.building_repo import BuildingRepository
-from app.schemas.room import RoomCreate, RoomUpdate
+from app.services.audit_service import expand_audit_users
+from app.schemas.room import RoomCreate, RoomUpdate, RoomFilter, RoomBatchUpdate
 
 
 class RoomService:
@@ -16,20 +19,24 @@ class RoomService:
         self.repo = RoomRepository(session)
         self.building_repo = BuildingRepository(session)
 
-    async def get_room(self, room_id: UUID) -> Room:
+    async def get_room(self, room_id: UUID, expand=()) -> Room:
         room = await self.repo.get_by_id(room_id)
         if not room:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Room not found"
             )
-        return room
+        return await expand_audit_users(self.session, room, expand)
 
-    async def list_rooms(self):
-        return await self.repo.list_all()
+    async def list_rooms(self, page: Optional[PageParams] = None, expand=(), filters: Optional[RoomFilter] = None,
+                         fields=None):
+        rooms = await self.repo.list_all(page, filters=filters, fields=fields)
+        return await expand_audit_users(self.session, rooms, expand)
 
-    async def list_rooms_by_building(self, building_id: UUID):
-        return await self.repo.list_by_building(building_id)
+    async def list_rooms_by_building(self, building_id: UUID, page: Optional[PageParams] = None, expand=(),
+                                     filters: Optional[RoomFilter] = None, fields=None):
+        rooms = await self.repo.list_by_building(building_id, page, filters=filters, fields=fields)
+        return await expand_audit_users(self.session, rooms, expand)
 
     async def create_room(self, payload: RoomCreate) -> Room:
         building = await self.building_repo.get_by_id(payload.building_id)
@@ -79,6 +86,37 @@ class RoomService:
 
         return await self.repo.update(room, update_data)
 
+    async def batch_update_rooms(self, payload: RoomBatchUpdate) -> int:
+        update_data = payload.changes.dict(exclude_unset=True)
+        update_data.pop("meta_info", None)
+
+        if not update_data:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No changes given"
+            )
+
+        if "room_no" in update_data:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Room code cannot be updated in a batch"
+            )
+
+        if update_data.get("capacity") is not None and update_data["capacity"] < 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Capacity cannot be negative"
+            )
+
+        update_data["updated_by_id"] = self.current_user.id
+
+        return await self.repo.batch_update(
+            update_data,
+            ids=payload.ids,
+            building_id=payload.building_id,
+            floor=payload.floor,
+        )
+
     async def delete_room(self, room_id: UUID):
         room = await self.get_room(room_id)
         return await self.repo.soft_delete(room)
@@ -0,0 +1,37 @@
+# services/stats_service.py
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.room_stats_cache import room_stats_cache
+from app.repositories.room_repo import RoomRepository
+from app.schemas.stats import RoomStats
+
+
+class StatsService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.repo = RoomRepository(session)
+
+    async def room_stats(self, group_by: str, campus_id: Optional[UUID] = None,
+                         building_id: Optional[UUID] = None) -> RoomStats:
+        if room_stats_cache.enabled:
+            if not room_stats_cache.is_fresh():
+                generation = room_stats_cache.begin_load()
+                room_stats_cache.load(generation, await self.repo.stats("floor"))
+            if room_stats_cache.is_fresh():
+                groups = room_stats_cache.aggregate(group_by, campus_id, building_id)
+                return self._build(group_by, groups)
+
+        groups = await self.repo.stats(group_by, campus_id, building_id)
+        return self._build(group_by, groups)
+
+    def _build(self, group_by: str, groups) -> RoomStats:
+        groups = [dict(group) for group in groups]
+        return RoomStats(
+            group_by=group_by,
+            total_rooms=sum(g["rooms"] for g in groups),
+            total_capacity=sum(g["capacity"] for g in groups),
+            groups=groups,
+        )
@@ -1,9 +1,11 @@
 from app.models.user import User
 from app.repositories.user_repo import UserRepository
-from app.auth.security import hash_password
+from app.auth.security import hash_password_async
 from fastapi import HTTPException, status
+from typing import Optional
 from uuid import UUID
 
+from app.core.pagination import PageParams
 from app.schemas.user import UserUpdate
 
 
@@ -25,7 +27,7 @@ class UserService:
                 detail="Username already taken"
             )
 
-        hashed_password = hash_password(password[:72])  # ensure bcrypt limit
+        hashed_password = await hash_password_async(password[:72])  # ensure bcrypt limit
 
         # Create user
         return await self.user_repo.create_user(
@@ -45,8 +47,8 @@ class UserService:
             )
         return user
 
-    async def list_users(self):
-        users = await self.user_repo.list_all()
+    async def list_users(self, page: Optional[PageParams] = None):
+        users = await self.user_repo.list_all(page)
         return users
 
     async def update_user(self, user_id: UUID, payload: UserUpdate) -> User:
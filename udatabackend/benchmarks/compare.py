@@ -0,0 +1,59 @@
+"""Compare two result files written by load.py or micro.py.
+
+Usage (from udatabackend/):
+
+    python benchmarks/compare.py before.json after.json
+
+Prints every numeric metric side by side with the relative change.
+"""
+import argparse
+import json
+
+# Metrics where a larger value is an improvement
+HIGHER_IS_BETTER = {"throughput_rps", "ops_per_s"}
+
+
+def flatten(metrics: dict, prefix: str = "") -> dict:
+    """Nested results (login_storm_mix) as "phase.metric" keys."""
+    flat = {}
+    for key, value in metrics.items():
+        if isinstance(value, dict) and key != "errors":
+            flat.update(flatten(value, f"{prefix}{key}."))
+        else:
+            flat[prefix + key] = value
+    return flat
+
+
+def main(before_path: str, after_path: str):
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+    if before["benchmark"] != after["benchmark"]:
+        raise SystemExit(f"cannot compare a {before['benchmark']} run with a {after['benchmark']} run")
+
+    print(f"{before['benchmark']}: {before.get('commit')} ({before['database']}) -> "
+          f"{after.get('commit')} ({after['database']})")
+    for case, metrics in before["results"].items():
+        if case not in after["results"]:
+            continue
+        print(case)
+        new_metrics = flatten(after["results"][case])
+        old_metrics = flatten(metrics)
+        width = max(20, *(len(metric) for metric in old_metrics))
+        for metric, old in old_metrics.items():
+            new = new_metrics.get(metric)
+            if not isinstance(old, (int, float)) or not isinstance(new, (int, float)):
+                continue
+            change = (new - old) / old * 100 if old else 0.0
+            better = change > 0 if metric.rsplit(".", 1)[-1] in HIGHER_IS_BETTER else change < 0
+            marker = "" if abs(change) < 5 else " better" if better else " WORSE"
+            print(f"  {metric:<{width}} {old:12.2f} {new:12.2f} {change:+7.1f}%{marker}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("before")
+    parser.add_argument("after")
+    args = parser.parse_args()
+    main(args.before, args.after)
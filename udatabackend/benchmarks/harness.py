@@ -0,0 +1,196 @@
+"""Shared setup for the benchmark scripts: database selection, seeding and reporting.
+
+The scripts put this directory and the project root on `sys.path`, call
+`use_database()` before importing anything from `app` (the engine reads
+DATABASE_URL at import time), then seed with `seed_university()`.
+"""
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASSWORD = "bench-password"
+
+
+def use_database(url: Optional[str]) -> str:
+    """Point the app at `url`, or at a throwaway SQLite file when it is None."""
+    if url is None:
+        url = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/bench.db"
+    os.environ["DATABASE_URL"] = url
+    os.environ.setdefault("ENV", "production")
+    return url
+
+
+def add_database_arguments(parser) -> None:
+    parser.add_argument("--database-url", default=None,
+                        help="database to benchmark against (default: a temporary SQLite file); "
+                             "seeded rows are added to it, so use a scratch database")
+    parser.add_argument("--output", default=None, help="write the results as JSON to this file")
+
+
+def add_seed_arguments(parser) -> None:
+    parser.add_argument("--campuses", type=int, default=2)
+    parser.add_argument("--buildings", type=int, default=10, help="buildings per campus")
+    parser.add_argument("--rooms", type=int, default=100, help="rooms per building")
+    parser.add_argument("--users", type=int, default=20)
+
+
+async def seed_university(campuses: int, buildings: int, rooms: int, users: int) -> dict:
+    """Create the schema and insert a synthetic university with multi-row INSERTs.
+
+    Every user gets the password `PASSWORD`; it is hashed once and shared so
+    seeding does not spend seconds on argon2. Codes carry a random run id, so
+    several runs can share one database. Returns the ids and usernames.
+    """
+    from sqlalchemy import insert
+
+    from app.auth.security import hash_password
+    from app.core.database import AsyncSessionLocal, create_tables
+    from app.models.building import Building
+    from app.models.campus import Campus
+    from app.models.enums import Role
+    from app.models.room import Room
+    from app.models.user import User
+
+    await create_tables()
+    run = uuid.uuid4().hex[:8]
+    now = datetime.utcnow()
+    hashed = hash_password(PASSWORD)
+
+    user_rows = [
+        {"id": uuid.uuid4(), "username": f"bench-{run}-{i}", "email": f"bench-{run}-{i}@example.com",
+         "full_name": f"Bench User {i}", "hashed_password": hashed, "role": Role.ADMIN, "created_at": now}
+        for i in range(users)
+    ]
+    campus_rows = [
+        {"id": uuid.uuid4(), "code": f"B{run}-{c}", "name": f"Campus {c}", "created_at": now}
+        for c in range(campuses)
+    ]
+    building_rows = [
+        {"id": uuid.uuid4(), "campus_id": campus["id"], "prefix": "B", "building_no": str(b),
+         "floors": 5, "created_at": now}
+        for campus in campus_rows
+        for b in range(buildings)
+    ]
+    room_rows = [
+        {"id": uuid.uuid4(), "building_id": building["id"], "prefix": "R", "room_no": str(r),
+         "floor": r % 5, "capacity": 10 + r % 90, "created_at": now}
+        for building in building_rows
+        for r in range(rooms)
+    ]
+
+    async with AsyncSessionLocal() as session:
+        for model, rows in ((User, user_rows), (Campus, campus_rows), (Building, building_rows), (Room, room_rows)):
+            for start in range(0, len(rows), 5000):
+                await session.execute(insert(model), rows[start:start + 5000])
+        await session.commit()
+
+    return {
+        "usernames": [row["username"] for row in user_rows],
+        "user_ids": [row["id"] for row in user_rows],
+        "campus_ids": [row["id"] for row in campus_rows],
+        "building_ids": [row["id"] for row in building_rows],
+        "room_ids": [row["id"] for row in room_rows],
+    }
+
+
+class QueryCounter:
+    """Counts statements sent to the database while it is active."""
+
+    def __init__(self, engine):
+        self.engine = engine.sync_engine
+        self.count = 0
+
+    def _count(self, *args):
+        self.count += 1
+
+    def __enter__(self) -> "QueryCounter":
+        from sqlalchemy import event
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *exc):
+        from sqlalchemy import event
+        event.remove(self.engine, "before_cursor_execute", self._count)
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def latency_summary(latencies: list[float]) -> dict:
+    """p50/p95/p99/max/mean in milliseconds."""
+    values = sorted(latencies)
+    return {
+        "p50_ms": percentile(values, 0.50) * 1000,
+        "p95_ms": percentile(values, 0.95) * 1000,
+        "p99_ms": percentile(values, 0.99) * 1000,
+        "max_ms": (values[-1] if values else 0.0) * 1000,
+        "mean_ms": (sum(values) / len(values) if values else 0.0) * 1000,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(path: Optional[str], benchmark: str, args, results: dict) -> None:
+    """Save `results` with enough context (commit, database, arguments) to compare runs."""
+    if path is None:
+        return
+    from sqlalchemy.engine import make_url
+
+    document = {
+        "benchmark": benchmark,
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "database": make_url(os.environ["DATABASE_URL"]).get_backend_name(),
+        "arguments": {k: v for k, v in vars(args).items() if k != "database_url"},
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2, default=str)
+    print(f"results written to {path}")
+
+
+def rss_bytes() -> int:
+    """Current resident set size of this process.
+
+    Read from /proc on Linux; elsewhere falls back to the peak RSS, which is
+    still enough to show growth.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Stopwatch:
+    def __enter__(self) -> "Stopwatch":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self.started
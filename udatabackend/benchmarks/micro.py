@@ -0,0 +1,127 @@
+"""Per-layer microbenchmarks: response serialization, auth, repository queries.
+
+Usage (from udatabackend/):
+
+    python benchmarks/micro.py --number 200 --output micro.json
+
+Each case runs `--number` times per round and reports the best round of
+`--repeat` in microseconds per operation, so a regression in one layer can
+be told apart from noise elsewhere in the request path. Repository cases
+open a fresh session per operation, like a request does.
+"""
+import argparse
+import asyncio
+import inspect
+import os
+import random
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import harness  # noqa: E402
+
+
+async def measure(fn, number: int, repeat: int) -> float:
+    """Best seconds per call of `fn` (sync or async) over `repeat` rounds."""
+    is_async = inspect.iscoroutinefunction(fn)
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            if is_async:
+                await fn()
+            else:
+                fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+
+async def main(args):
+    from pydantic import TypeAdapter
+
+    from app.auth.dependencies import get_current_user
+    from app.auth.principal_cache import principal_cache
+    from app.auth.security import create_access_token, decode_access_token
+    from app.auth.token_cache import token_cache
+    from app.core.database import AsyncSessionLocal, engine
+    from app.core.pagination import PageParams
+    from app.repositories.room_repo import RoomRepository
+    from app.schemas.room import RoomResponse
+
+    seed = await harness.seed_university(args.campuses, args.buildings, args.rooms, args.users)
+    rng = random.Random(0)
+    room_ids = seed["room_ids"]
+    building_ids = seed["building_ids"]
+
+    async with AsyncSessionLocal() as session:
+        page_of_rooms = (await RoomRepository(session).list_all(PageParams(limit=100)))["items"]
+    one_room = RoomResponse.model_validate(page_of_rooms[0])
+    list_adapter = TypeAdapter(List[RoomResponse])
+    token = create_access_token(str(rng.choice(seed["user_ids"])))
+
+    async def auth_uncached():
+        token_cache.clear()
+        principal_cache.clear()
+        async with AsyncSessionLocal() as session:
+            await get_current_user(token, session)
+
+    async def auth_principal_cached():
+        token_cache.clear()
+        await get_current_user(token, None)
+
+    async def auth_cached():
+        await get_current_user(token, None)
+
+    async def get_by_id():
+        async with AsyncSessionLocal() as session:
+            await RoomRepository(session).get_by_id(rng.choice(room_ids))
+
+    async def list_by_building():
+        async with AsyncSessionLocal() as session:
+            await RoomRepository(session).list_by_building(rng.choice(building_ids), PageParams(limit=50))
+
+    async def list_first_page():
+        async with AsyncSessionLocal() as session:
+            await RoomRepository(session).list_all(PageParams(limit=100))
+
+    async def stats_by_building():
+        async with AsyncSessionLocal() as session:
+            await RoomRepository(session).stats("building")
+
+    cases = {
+        "serialize: RoomResponse": lambda: one_room.model_dump_json(),
+        "serialize: 100 rooms from ORM": lambda: list_adapter.dump_json(
+            list_adapter.validate_python(page_of_rooms, from_attributes=True)),
+        "jwt: encode": lambda: create_access_token("00000000-0000-0000-0000-000000000000"),
+        "jwt: decode": lambda: decode_access_token(token),
+        "auth: token cache hit": lambda: token_cache.get(token),
+        "auth: get_current_user, cold": auth_uncached,
+        "auth: get_current_user, user cached": auth_principal_cached,
+        "auth: get_current_user, all cached": auth_cached,
+        "repo: get_by_id": get_by_id,
+        "repo: list_by_building (50)": list_by_building,
+        "repo: list_all first page (100)": list_first_page,
+        "repo: stats by building": stats_by_building,
+    }
+
+    results = {}
+    for label, fn in cases.items():
+        seconds = await measure(fn, args.number, args.repeat)
+        results[label] = {"us_per_op": seconds * 1e6, "ops_per_s": 1 / seconds}
+        print(f"{label:<34} {seconds * 1e6:10.1f} us/op {1 / seconds:10.0f} ops/s")
+
+    harness.write_results(args.output, "micro", args, results)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    harness.add_database_arguments(parser)
+    harness.add_seed_arguments(parser)
+    parser.add_argument("--number", type=int, default=200, help="operations per round")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    harness.use_database(args.database_url)
+    asyncio.run(main(args))
@@ -0,0 +1,105 @@
+"""Compare the response-model serialization path with the fast row path.
+
+Usage (from udatabackend/):
+
+    python benchmarks/serialization.py --rows 20000
+
+Seeds a throwaway SQLite database with one campus, one building and `--rows`
+rooms, then times listing them both ways: entities validated and dumped
+through `List[RoomResponse]`, and plain column rows encoded directly (the
+FAST_SERIALIZATION path). Both bodies are checked to be identical.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_db_dir = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_db_dir}/bench.db")
+os.environ.setdefault("ENV", "production")
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.core.database import AsyncSessionLocal, create_tables, engine  # noqa: E402
+from app.core.encoding import row_template  # noqa: E402
+from app.core.response_cache import _encode_rows  # noqa: E402
+from app.models.building import Building  # noqa: E402
+from app.models.campus import Campus  # noqa: E402
+from app.repositories.room_repo import RoomRepository  # noqa: E402
+from app.schemas.room import RoomResponse  # noqa: E402
+
+
+async def seed(rows: int):
+    async with AsyncSessionLocal() as session:
+        campus = Campus(code="BENCH", name="Bench")
+        session.add(campus)
+        await session.flush()
+        building = Building(campus_id=campus.id, prefix="B", building_no="1")
+        session.add(building)
+        await session.flush()
+        now = datetime.utcnow()
+        await RoomRepository(session).bulk_insert([
+            {
+                "id": uuid.uuid4(), "building_id": building.id, "prefix": "R",
+                "room_no": str(i), "capacity": i % 50, "floor": i % 5, "created_at": now,
+            }
+            for i in range(rows)
+        ])
+        await session.commit()
+
+
+def timed(label: str, rows: int, seconds: float):
+    print(f"{label:<32} {seconds * 1000:9.1f} ms  {seconds / rows * 1e6:7.2f} us/row")
+
+
+async def main(rows: int, repeat: int):
+    await create_tables()
+    await seed(rows)
+
+    adapter = TypeAdapter(List[RoomResponse])
+    fields = row_template(RoomResponse)
+
+    best = {}
+    for _ in range(repeat):
+        async with AsyncSessionLocal() as session:
+            repo = RoomRepository(session)
+
+            start = time.perf_counter()
+            entities = await repo.list_all()
+            loaded = time.perf_counter()
+            model_body = adapter.dump_json(adapter.validate_python(entities, from_attributes=True))
+            done = time.perf_counter()
+            best["model: query"] = min(best.get("model: query", 1e9), loaded - start)
+            best["model: serialize"] = min(best.get("model: serialize", 1e9), done - loaded)
+
+            start = time.perf_counter()
+            mappings = await repo.list_all(fields=list(fields))
+            loaded = time.perf_counter()
+            fast_body = _encode_rows(mappings, fields)
+            done = time.perf_counter()
+            best["fast: query"] = min(best.get("fast: query", 1e9), loaded - start)
+            best["fast: serialize"] = min(best.get("fast: serialize", 1e9), done - loaded)
+
+        assert model_body == fast_body, "fast path changed the wire format"
+
+    print(f"{rows} rooms, best of {repeat}")
+    for label, seconds in best.items():
+        timed(label, rows, seconds)
+    print(f"serialization speedup: {best['model: serialize'] / best['fast: serialize']:.1f}x")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -1,10 +1,24 @@
-from fastapi import FastAPI
+import time
+
+_import_started = time.perf_counter()
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.database import create_tables
+from app.core.database import dispose_engine, ensure_schema
+from app.core.pagination import InvalidCursorError
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.request_metrics import MetricsMiddleware
+from app.core.startup import startup_report
+from app.auth.security import hashing_pool
 from app.routers.campus import router as campus_router  # import router
 from app.routers.auth import router as auth_router
 from app.routers.building import router as building_router
 from app.routers.room import router as room_router
+from app.routers.imports import router as import_router
+from app.routers.export import router as export_router
+from app.routers.stats import router as stats_router
+from app.routers.metrics import router as metrics_router
 
 app = FastAPI(title="UData")
 
@@ -24,11 +38,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Query-Count", "X-Query-Time-Ms", "X-Query-Rows", "X-Query-Rows-Written", "X-Query-Max-Repeats"],
 )
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(MetricsMiddleware)
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
 
 @app.on_event("startup")
 async def startup():
-    await create_tables()
+    started = time.perf_counter()
+    schema_created = await ensure_schema()
+    startup_report.started(started, schema_created)
+
+@app.on_event("shutdown")
+async def shutdown():
+    hashing_pool.shutdown()
+    await dispose_engine()
 
 @app.get("/")
 def home():
@@ -39,4 +67,9 @@ app.include_router(auth_router)
 app.include_router(campus_router)
 app.include_router(building_router)
 app.include_router(room_router)
+app.include_router(import_router)
+app.include_router(export_router)
+app.include_router(stats_router)
+app.include_router(metrics_router)
 
+startup_report.imported(_import_started)
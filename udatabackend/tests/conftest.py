@@ -0,0 +1,52 @@
+"""Shared fixtures: the app runs against a throwaway SQLite database seeded once per session.
+
+Like the benchmark scripts, this puts the project root and benchmarks/ on
+`sys.path` and selects the database before anything imports `app`.
+"""
+import os
+import sys
+
+import httpx
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import harness  # noqa: E402
+
+harness.use_database(None)
+
+# registers every model and route, as the server does on start
+import main  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def seed(anyio_backend):
+    """A small university (2 campuses, 20 buildings, 400 rooms, 5 users).
+
+    Room ids are grouped by building: rooms `20 * i` to `20 * i + 19` belong
+    to building `i`, on floors 0-4. Tests that write take buildings of their
+    own, counting down from the last one.
+    """
+    from app.core.database import dispose_engine
+
+    yield await harness.seed_university(campuses=2, buildings=10, rooms=20, users=5)
+    await dispose_engine()
+
+
+@pytest.fixture(scope="session")
+async def client(seed):
+    """httpx client calling the app in-process, logged in as a seeded admin."""
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/auth/login", json={"username": seed["usernames"][0],
+                                                          "password": harness.PASSWORD})
+        response.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+        yield client
@@ -0,0 +1,72 @@
+"""Cascade soft-delete and restore of a campus subtree.
+
+The whole subtree is stamped with one `deleted_at`; restore matches on it, so
+rows deleted before the campus stay deleted.
+"""
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+from app.core.database import AsyncSessionLocal
+from app.models.building import Building
+from app.models.campus import Campus
+from app.models.room import Room
+
+pytestmark = pytest.mark.anyio
+
+
+async def post(client, url: str, payload: dict) -> str:
+    response = await client.post(url, json=payload)
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+async def deleted_at(model, ids) -> dict:
+    async with AsyncSessionLocal() as session:
+        rows = await session.execute(
+            select(model.id, model.deleted_at).where(model.id.in_([uuid.UUID(i) for i in ids]))
+        )
+        return {str(id_): stamp for id_, stamp in rows}
+
+
+@pytest.fixture
+async def campus(client):
+    code = f"CAS-{uuid.uuid4().hex[:8]}"
+    campus_id = await post(client, "/campuses/", {"code": code, "name": "Cascade", "address": "Cascade Rd"})
+    buildings = [
+        await post(client, "/buildings/", {"campus_id": campus_id, "prefix": code, "building_no": str(no)})
+        for no in range(2)
+    ]
+    rooms = [
+        await post(client, "/rooms/", {"building_id": building, "prefix": "R", "room_no": str(no)})
+        for building in buildings for no in range(3)
+    ]
+    return campus_id, buildings, rooms
+
+
+async def test_cascade_delete_and_restore(client, campus):
+    campus_id, buildings, rooms = campus
+    earlier, rooms = rooms[0], rooms[1:]
+    assert (await client.delete(f"/rooms/{earlier}")).status_code == 200
+    earlier_stamp = (await deleted_at(Room, [earlier]))[earlier]
+
+    response = await client.delete(f"/campuses/{campus_id}", params={"cascade": "true"})
+    assert response.status_code == 200, response.text
+
+    stamp = (await deleted_at(Campus, [campus_id]))[campus_id]
+    assert stamp is not None and stamp != earlier_stamp
+    assert set((await deleted_at(Building, buildings)).values()) == {stamp}
+    assert set((await deleted_at(Room, rooms)).values()) == {stamp}
+    assert (await deleted_at(Room, [earlier]))[earlier] == earlier_stamp
+
+    response = await client.post(f"/campuses/{campus_id}/restore", params={"cascade": "true"})
+    assert response.status_code == 200, response.text
+
+    assert (await deleted_at(Campus, [campus_id]))[campus_id] is None
+    assert set((await deleted_at(Building, buildings)).values()) == {None}
+    assert set((await deleted_at(Room, rooms)).values()) == {None}
+    assert (await deleted_at(Room, [earlier]))[earlier] == earlier_stamp
+
+    listed = (await client.get(f"/rooms/building/{buildings[0]}")).json()
+    assert sorted(room["id"] for room in listed) == sorted(rooms[:2])
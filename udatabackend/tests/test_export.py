@@ -0,0 +1,41 @@
+"""GET /export/{kind}: the CSV header does not depend on there being rows."""
+import csv
+import io
+
+import pytest
+from sqlalchemy import false
+
+from app.repositories.campus_repo import CampusRepository
+
+pytestmark = pytest.mark.anyio
+
+
+async def export(client, kind: str, **params):
+    response = await client.get(f"/export/{kind}", params=params)
+    return response, list(csv.reader(io.StringIO(response.text)))
+
+
+async def test_csv_header_matches_rows(client):
+    response, rows = await export(client, "rooms", format="csv", flatten="true")
+    assert response.status_code == 200
+    header = rows[0]
+    assert header[:2] == ["id", "building_id"]
+    assert "campus_code" in header and "deleted_at" not in header
+    assert len(rows) > 1
+    assert all(len(row) == len(header) for row in rows[1:])
+
+
+async def test_empty_csv_export_has_header(client, monkeypatch):
+    export_select = CampusRepository.export_select
+    monkeypatch.setattr(CampusRepository, "export_select",
+                        lambda self, flatten=False: export_select(self, flatten).where(false()))
+
+    response, rows = await export(client, "campuses", format="csv")
+    assert response.status_code == 200
+    assert rows == [["id", "code", "name", "address", "status", "created_at", "updated_at",
+                     "created_by_id", "updated_by_id"]]
+
+
+async def test_flatten_campuses_is_rejected(client):
+    response = await client.get("/export/campuses", params={"flatten": "true"})
+    assert response.status_code == 400
@@ -0,0 +1,45 @@
+"""Admission control of the password hashing pool."""
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.auth.hashing_pool import HashingPool
+
+pytestmark = pytest.mark.anyio
+
+
+async def until(condition) -> None:
+    for _ in range(1000):
+        if condition():
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError("condition not reached")
+
+
+async def test_requests_beyond_the_queue_get_503():
+    pool = HashingPool(max_workers=1, max_queue=1)
+    gate = threading.Event()
+    try:
+        running = asyncio.create_task(pool.run(gate.wait))
+        await until(lambda: pool.in_flight == 1)
+        waiting = asyncio.create_task(pool.run(gate.wait))
+        await until(lambda: pool.queued == 1)
+
+        with pytest.raises(HTTPException) as raised:
+            await asyncio.wait_for(pool.run(gate.wait), timeout=1)
+        assert raised.value.status_code == 503
+        assert pool.stats() | {"avg_wait": 0.0, "max_wait": 0.0} == {
+            "workers": 1, "max_queue": 1, "queued": 1, "in_flight": 1, "completed": 0,
+            "rejected": 1, "max_queued": 1, "avg_wait": 0.0, "max_wait": 0.0,
+        }
+
+        gate.set()
+        assert await asyncio.gather(running, waiting) == [True, True]
+        stats = pool.stats()
+        assert (stats["queued"], stats["in_flight"], stats["completed"], stats["rejected"]) == (0, 0, 2, 1)
+        assert stats["max_wait"] > 0
+    finally:
+        gate.set()
+        pool.shutdown()
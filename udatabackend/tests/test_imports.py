@@ -0,0 +1,95 @@
+"""Reports of POST /import/{kind}: every row is counted once, as created, skipped or failed."""
+import io
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+
+from app.core.database import AsyncSessionLocal
+from app.models.room import Room
+from app.services.import_service import ImportService, read_rows
+
+pytestmark = pytest.mark.anyio
+
+
+async def post_import(client, kind: str, body: bytes, filename: str) -> dict:
+    response = await client.post(f"/import/{kind}", files={"file": (filename, body)})
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert report["total"] == report["created"] + report["skipped"] + report["failed"]
+    return report
+
+
+def errors_by_row(report: dict) -> dict:
+    return {error["row"]: error["error"] for error in report["errors"]}
+
+
+async def test_room_csv_report(client, seed):
+    building = seed["building_ids"][15]
+    body = "\n".join([
+        "building_id,prefix,room_no,capacity",
+        f"{building},R,import-1,10",
+        f"{building},R,import-1,20",
+        f"{uuid.uuid4()},R,import-2,10",
+        f"{building},R,import-3,lots",
+        f"{building},R,0,10",
+        f"{building},R,import-4,10",
+    ]).encode() + b"\n" + f"{building},R,caf\xe9,10".encode("latin-1") + b"\n"
+
+    report = await post_import(client, "rooms", b"\xef\xbb\xbf" + body, "rooms.csv")
+
+    assert (report["total"], report["created"], report["skipped"], report["failed"]) == (7, 2, 2, 3)
+    errors = errors_by_row(report)
+    assert errors[2] == "Duplicate of row 1"
+    assert errors[3] == "Building not found"
+    assert errors[4].startswith("capacity:")
+    assert errors[5] == "Already exists"
+    assert errors[7].startswith("Unreadable row:")
+    assert 1 not in errors and 6 not in errors
+
+
+async def test_ndjson_report(client):
+    code = f"IMP-{uuid.uuid4().hex[:8]}"
+    body = "\n".join([
+        f'{{"code": "{code}", "name": "Imported"}}',
+        "",
+        "{not json",
+        "[1, 2]",
+        f'{{"code": "{code}", "name": "Again"}}',
+    ]).encode()
+
+    report = await post_import(client, "campuses", body, "campuses.ndjson")
+
+    assert (report["total"], report["created"], report["skipped"], report["failed"]) == (4, 1, 1, 2)
+    errors = errors_by_row(report)
+    assert errors[2].startswith("Unreadable row:")
+    assert errors[3] == "Unreadable row: Expected a JSON object"
+    assert errors[4] == "Duplicate of row 1"
+
+
+async def test_failed_chunk_does_not_lose_the_report(seed, monkeypatch):
+    building = seed["building_ids"][15]
+    lines = ["building_id,prefix,room_no"] + [f"{building},R,chunk-{i}" for i in range(6)]
+    calls = []
+    original = ImportService._import_rooms
+
+    async def second_chunk_fails(self, valid, report):
+        calls.append(len(valid))
+        await original(self, valid, report)
+        if len(calls) == 2:
+            raise OperationalError("INSERT", {}, Exception("database is locked"))
+
+    monkeypatch.setattr(ImportService, "_import_rooms", second_chunk_fails)
+    async with AsyncSessionLocal() as session:
+        service = ImportService(session, None, chunk_size=2)
+        report = await service.import_rows("rooms", read_rows(io.BytesIO("\n".join(lines).encode()), "csv"))
+        stored = await session.scalars(
+            select(Room.room_no).where(Room.building_id == building, Room.room_no.startswith("chunk-"))
+        )
+
+    assert calls == [2, 2, 2]
+    assert (report.total, report.created, report.skipped, report.failed) == (6, 4, 0, 2)
+    assert [error.row for error in report.errors] == [3, 4]
+    assert "database is locked" in report.errors[0].error
+    assert sorted(stored) == ["chunk-0", "chunk-1", "chunk-4", "chunk-5"]
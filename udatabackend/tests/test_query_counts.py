@@ -0,0 +1,64 @@
+"""Statement budgets of the hot endpoints.
+
+A new lazy load or per-row lookup in a listing multiplies its queries by
+the page size; these tests fail as soon as one of the requests below needs
+more statements than it does today. Each budget counts a cold request:
+the token and user caches are emptied and the response cache is off.
+"""
+import pytest
+
+from app.auth.principal_cache import principal_cache
+from app.auth.token_cache import token_cache
+from app.core.query_stats import assert_max_queries, collect_queries
+from app.core.response_cache import response_cache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def cold_caches(monkeypatch):
+    token_cache.clear()
+    principal_cache.clear()
+    monkeypatch.setattr(response_cache, "ttl", 0)
+
+
+async def get(client, url: str, budget: int, **params):
+    with assert_max_queries(budget):
+        response = await client.get(url, params=params)
+    assert response.status_code == 200, response.text
+
+
+# user, table versions, rooms
+async def test_room_list(client):
+    await get(client, "/rooms/", 3)
+
+
+async def test_room_list_page(client):
+    first = (await client.get("/rooms/", params={"limit": 50})).json()
+    token_cache.clear()
+    principal_cache.clear()
+    await get(client, "/rooms/", 3, limit=50, cursor=first["next_cursor"])
+
+
+async def test_room_list_by_building(client, seed):
+    await get(client, "/rooms/", 3, building_id=str(seed["building_ids"][0]))
+
+
+async def test_room_detail(client, seed):
+    await get(client, f"/rooms/{seed['room_ids'][0]}", 3)
+
+
+# user, table versions, then one flat query per level however many rows
+async def test_campus_tree(client):
+    await get(client, "/campuses/tree", 5)
+
+
+async def test_rows_returned_are_counted(client, seed):
+    with collect_queries() as stats:
+        response = await client.get(f"/rooms/building/{seed['building_ids'][0]}")
+    assert response.status_code == 200
+    # the building's rooms are the largest result; the user and table version
+    # lookups add at most a row each
+    assert stats.max_rows == 20
+    assert 20 <= stats.rows <= 22
+    assert stats.rows_written == 0
@@ -0,0 +1,111 @@
+"""The lookups behind the hot endpoints must be served by an index.
+
+Each test runs repository methods against the seeded SQLite database,
+captures the statements they send and asks SQLite for their plans. A
+`SCAN <table>` step without an index means a full table scan, which only
+shows up as latency once the tables are large.
+"""
+import re
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app.core.database import AsyncSessionLocal, get_engine
+from app.core.pagination import PageParams
+from app.core.base import BaseModel
+from app.repositories.building_repo import BuildingRepository
+from app.repositories.room_repo import RoomRepository
+from app.repositories.user_repo import UserRepository
+
+pytestmark = pytest.mark.anyio
+
+SCAN = re.compile(r"\bSCAN (\w+)")
+
+
+@contextmanager
+def captured_statements():
+    """(sql, parameters) of every statement sent inside the block."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    engine = get_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+async def table_scans(statements) -> list[str]:
+    """Plan steps of `statements` that read a whole table without an index."""
+    tables = set(BaseModel.metadata.tables)
+    scans = []
+    async with get_engine().connect() as conn:
+        for sql, parameters in statements:
+            plan = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", parameters)
+            for row in plan:
+                detail = row[-1]
+                match = SCAN.search(detail)
+                if match and match.group(1) in tables and "USING" not in detail:
+                    scans.append(f"{detail}\n    in: {sql}")
+    return scans
+
+
+async def assert_indexed(run):
+    with captured_statements() as statements:
+        async with AsyncSessionLocal() as session:
+            await run(session)
+    assert statements, "nothing was sent to the database"
+    scans = await table_scans(statements)
+    assert not scans, "full table scans:\n  " + "\n  ".join(scans)
+
+
+async def test_room_list_by_building(seed):
+    async def run(session):
+        repo = RoomRepository(session)
+        await repo.list_by_building(seed["building_ids"][0])
+        first = await repo.list_by_building(seed["building_ids"][0], PageParams(limit=5))
+        await repo.list_by_building(seed["building_ids"][0], PageParams(limit=5, cursor=first["next_cursor"]))
+
+    await assert_indexed(run)
+
+
+async def test_building_list_by_campus(seed):
+    async def run(session):
+        repo = BuildingRepository(session)
+        await repo.list_buildings_by_campus(seed["campus_ids"][0])
+        first = await repo.list_buildings_by_campus(seed["campus_ids"][0], PageParams(limit=5))
+        await repo.list_buildings_by_campus(seed["campus_ids"][0], PageParams(limit=5, cursor=first["next_cursor"]))
+
+    await assert_indexed(run)
+
+
+async def test_get_by_id(seed):
+    async def run(session):
+        await RoomRepository(session).get_by_id(seed["room_ids"][0])
+        await BuildingRepository(session).get_by_id(seed["building_ids"][0])
+        await UserRepository(session).get_by_id(seed["user_ids"][0])
+        await RoomRepository(session).get_many(seed["room_ids"][:10])
+
+    await assert_indexed(run)
+
+
+async def test_user_lookups(seed):
+    async def run(session):
+        repo = UserRepository(session)
+        await repo.get_by_username(seed["usernames"][0])
+        await repo.get_by_email(f"{seed['usernames'][0]}@example.com")
+
+    await assert_indexed(run)
+
+
+async def test_keyset_pages(seed):
+    async def run(session):
+        repo = RoomRepository(session)
+        first = await repo.list_all(PageParams(limit=50))
+        await repo.list_all(PageParams(limit=50, cursor=first["next_cursor"]))
+
+    await assert_indexed(run)
@@ -0,0 +1,125 @@
+"""Conditional GETs and the response cache against writes.
+
+Cached bodies and ETags are keyed by table versions; every write path has
+to bump them, or readers keep getting the old body (or a 304) forever.
+"""
+import pytest
+
+from app.core.response_cache import response_cache
+
+pytestmark = pytest.mark.anyio
+
+
+def rooms_of(seed, building: int) -> list:
+    return seed["room_ids"][20 * building:20 * building + 20]
+
+
+async def get(client, url: str, **kwargs):
+    response = await client.get(url, **kwargs)
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"]
+    return response
+
+
+async def test_etag_answers_304(client, seed):
+    url = f"/rooms/{rooms_of(seed, 19)[0]}"
+    first = await get(client, url)
+
+    again = await client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304
+    assert again.headers["ETag"] == first.headers["ETag"]
+    assert again.content == b""
+
+
+async def test_repeated_read_is_served_from_cache(client, seed):
+    url = f"/rooms/building/{seed['building_ids'][19]}"
+    first = await get(client, url)
+    hits = response_cache.hits
+
+    second = await get(client, url)
+    assert response_cache.hits == hits + 1
+    assert second.content == first.content
+
+
+async def test_put_invalidates(client, seed):
+    room_id = rooms_of(seed, 18)[0]
+    url = f"/rooms/{room_id}"
+    before = await get(client, url)
+    await get(client, url)
+
+    response = await client.put(url, json={"capacity": 321})
+    assert response.status_code == 200, response.text
+
+    after = await client.get(url, headers={"If-None-Match": before.headers["ETag"]})
+    assert after.status_code == 200
+    assert after.headers["ETag"] != before.headers["ETag"]
+    assert after.json()["capacity"] == 321
+
+
+async def test_batch_update_invalidates(client, seed):
+    building_id = seed["building_ids"][18]
+    url = f"/rooms/building/{building_id}"
+    before = await get(client, url)
+    assert {room["status"] for room in before.json()} != {"MAINTENANCE"}
+
+    response = await client.patch("/rooms/batch", json={"building_id": str(building_id),
+                                                        "changes": {"status": "MAINTENANCE"}})
+    assert response.status_code == 200, response.text
+    assert response.json()["updated"] == 20
+
+    after = await get(client, url)
+    assert after.headers["ETag"] != before.headers["ETag"]
+    assert {room["status"] for room in after.json()} == {"MAINTENANCE"}
+
+
+async def test_cascade_delete_invalidates(client, seed):
+    building_id = seed["building_ids"][17]
+    room_url = f"/rooms/{rooms_of(seed, 17)[0]}"
+    list_url = f"/rooms/building/{building_id}"
+    room_before = await get(client, room_url)
+    list_before = await get(client, list_url)
+    assert len(list_before.json()) == 20
+
+    response = await client.delete(f"/buildings/{building_id}", params={"cascade": "true"})
+    assert response.status_code == 200, response.text
+
+    assert (await client.get(room_url, headers={"If-None-Match": room_before.headers["ETag"]})).status_code == 404
+    list_after = await get(client, list_url, headers={"If-None-Match": list_before.headers["ETag"]})
+    assert list_after.json() == []
+
+
+async def test_expand_is_cached_separately(client, seed):
+    room_id = rooms_of(seed, 16)[0]
+    url = f"/rooms/{room_id}"
+    assert (await client.put(url, json={"capacity": 42})).status_code == 200
+
+    plain = await get(client, url)
+    expanded = await get(client, url, params={"expand": "updated_by"})
+    assert expanded.headers["ETag"] != plain.headers["ETag"]
+    assert expanded.json()["updated_by"]["username"] == seed["usernames"][0]
+    assert plain.json().get("updated_by") is None
+
+    # each variant keeps its own entry and ETag
+    assert (await get(client, url)).content == plain.content
+    assert (await client.get(url, params={"expand": "updated_by"},
+                             headers={"If-None-Match": plain.headers["ETag"]})).status_code == 200
+
+
+async def test_campus_tree_is_cached_and_invalidated(client, seed):
+    campus_id = seed["campus_ids"][1]
+    url = f"/campuses/{campus_id}/tree"
+    before = await get(client, url)
+    hits = response_cache.hits
+    assert (await get(client, url)).content == before.content
+    assert response_cache.hits == hits + 1
+
+    room_id = rooms_of(seed, 14)[0]
+    assert (await client.put(f"/rooms/{room_id}", json={"capacity": 77})).status_code == 200
+
+    after = await get(client, url)
+    assert after.headers["ETag"] != before.headers["ETag"]
+    rooms = {room["id"]: room for building in after.json()["buildings"] for room in building["rooms"]}
+    assert rooms[str(room_id)]["capacity"] == 77
+
+    trees = await get(client, "/campuses/tree")
+    assert after.json() in trees.json()
@@ -0,0 +1,64 @@
+"""Verified tokens are cached until their own `exp` and never beyond; rejected ones never."""
+import uuid
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from app.auth import dependencies, token_cache as token_cache_module
+from app.auth.security import create_access_token
+from app.auth.token_cache import TokenCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A settable clock for the token cache; starts at the current time."""
+    now = SimpleNamespace(value=token_cache_module.time.time())
+    monkeypatch.setattr(token_cache_module, "time", SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+@pytest.fixture
+def cache(monkeypatch) -> TokenCache:
+    cache = TokenCache(maxsize=8)
+    monkeypatch.setattr(dependencies, "token_cache", cache)
+    return cache
+
+
+def test_entry_expires_at_token_exp(clock, cache):
+    user_id = uuid.uuid4()
+    token = create_access_token(str(user_id), expires_delta=timedelta(minutes=5))
+    exp = jwt.get_unverified_claims(token)["exp"]
+
+    assert dependencies._verify_token(token) == user_id
+    assert cache.stats()["size"] == 1
+
+    clock.value = exp - 0.001
+    assert cache.get(token) == user_id
+
+    clock.value = exp
+    assert cache.get(token) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_entry_past_exp_is_not_stored(clock, cache):
+    cache.set("token", uuid.uuid4(), clock.value)
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.parametrize("make_token", [
+    lambda: "not-a-jwt",
+    lambda: create_access_token(str(uuid.uuid4())) + "x",
+    lambda: create_access_token(str(uuid.uuid4()), expires_delta=timedelta(seconds=-1)),
+    lambda: create_access_token("not-a-uuid"),
+    lambda: jwt.encode({"sub": str(uuid.uuid4())}, "wrong-secret", algorithm="HS256"),
+], ids=["garbage", "bad-signature", "expired", "bad-subject", "foreign-key"])
+def test_invalid_token_is_never_cached(clock, cache, make_token):
+    token = make_token()
+    with pytest.raises(HTTPException) as raised:
+        dependencies._verify_token(token)
+    assert raised.value.status_code == 401
+    assert cache.stats()["size"] == 0
+    assert cache.get(token) is None
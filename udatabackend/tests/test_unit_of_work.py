@@ -0,0 +1,63 @@
+"""A write that raises is rolled back as a whole.
+
+Nothing it flushed is committed, its `after_commit` callbacks never run, and
+neither the table versions nor the in-process caches move.
+"""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.core.database import AsyncSessionLocal
+from app.core.room_stats_cache import room_stats_cache
+from app.core.table_versions import get_versions
+from app.core.unit_of_work import UnitOfWork, after_commit
+from app.models.room import Room
+from app.services.room_service import RoomService
+
+pytestmark = pytest.mark.anyio
+
+
+async def versions() -> tuple:
+    async with AsyncSessionLocal() as session:
+        return await get_versions(session, ("room",))
+
+
+async def test_callbacks_are_dropped_on_rollback():
+    called = []
+    async with AsyncSessionLocal() as session:
+        with pytest.raises(RuntimeError):
+            async with UnitOfWork(session):
+                after_commit(session, lambda: called.append("rolled back"))
+                raise RuntimeError("boom")
+
+        # the next transaction on the same session must not inherit them
+        async with UnitOfWork(session):
+            after_commit(session, lambda: called.append("committed"))
+
+    assert called == ["committed"]
+
+
+async def test_failed_write_route_changes_nothing(client, seed, monkeypatch):
+    building_id = seed["building_ids"][13]
+    room_id = seed["room_ids"][20 * 13]
+    stats_url = "/stats/rooms"
+    stats_params = {"building_id": str(building_id), "group_by": "floor"}
+    stats_before = (await client.get(stats_url, params=stats_params)).json()
+    generation = room_stats_cache._generation
+    versions_before = await versions()
+    original = RoomService.update_room
+
+    async def update_then_fail(self, *args, **kwargs):
+        await original(self, *args, **kwargs)
+        raise HTTPException(status_code=409, detail="Conflict after flush")
+
+    monkeypatch.setattr(RoomService, "update_room", update_then_fail)
+    response = await client.put(f"/rooms/{room_id}", json={"capacity": 999, "floor": 42})
+    assert response.status_code == 409, response.text
+
+    async with AsyncSessionLocal() as session:
+        room = await session.scalar(select(Room).where(Room.id == room_id))
+    assert (room.capacity, room.floor) != (999, 42)
+    assert await versions() == versions_before
+    assert room_stats_cache._generation == generation
+    assert (await client.get(stats_url, params=stats_params)).json() == stats_before